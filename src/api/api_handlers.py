@@ -4,6 +4,8 @@ API method handlers for the I3 Gateway.
 Implements all JSON-RPC methods for MUD communication.
 """
 
+import asyncio
+import contextlib
 from datetime import datetime
 from typing import Any, Dict
 
@@ -50,6 +52,8 @@ class APIHandlers:
         self.state_manager = (
             state_manager or getattr(gateway, "state_manager", None) or StateManager()
         )
+        # Background gateway reconnect started by the reconnect method, if any
+        self._reconnect_task: asyncio.Task[None] | None = None
 
         # Method registry
         self.methods = {
@@ -768,10 +772,29 @@ class APIHandlers:
             {status}
         """
         if self.gateway:
-            await self.gateway.reconnect()
+            if self._reconnect_task is not None and not self._reconnect_task.done():
+                return {"status": "already_reconnecting"}
+            # Reconnecting can take seconds; acknowledge now and let it run
+            self._reconnect_task = asyncio.create_task(self._reconnect_gateway())
             return {"status": "reconnecting"}
         return {"status": "no_gateway"}
 
+    async def _reconnect_gateway(self) -> None:
+        """Reconnect the gateway in the background, logging any failure."""
+        try:
+            await self.gateway.reconnect()
+        except Exception as e:
+            logger.error("gateway_reconnect_failed", error=str(e))
+
+    async def shutdown(self) -> None:
+        """Cancel any reconnect still running in the background."""
+        task = self._reconnect_task
+        self._reconnect_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
     async def handle_heartbeat(self, session: Session, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle heartbeat/keepalive from client.
 
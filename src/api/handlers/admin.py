@@ -15,10 +15,15 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Scheduled admin operations, held so they are not garbage collected mid-run
+_background_tasks: set[asyncio.Task[None]] = set()
+
 
 class StatusHandler(BaseHandler):
     """Handler for getting gateway status."""
 
+    __slots__ = ()
+
     def validate_params(self, params: Dict[str, Any]) -> bool:
         """Validate status parameters."""
         # No parameters required
@@ -74,28 +79,10 @@ class StatusHandler(BaseHandler):
                 }
 
             # Get service status
+            services = self.gateway.services if hasattr(self.gateway, "services") else {}
             status["services"] = {
-                "tell": (
-                    self.gateway.services.get("tell", 0) if hasattr(self.gateway, "services") else 0
-                ),
-                "channel": (
-                    self.gateway.services.get("channel", 0)
-                    if hasattr(self.gateway, "services")
-                    else 0
-                ),
-                "who": (
-                    self.gateway.services.get("who", 0) if hasattr(self.gateway, "services") else 0
-                ),
-                "finger": (
-                    self.gateway.services.get("finger", 0)
-                    if hasattr(self.gateway, "services")
-                    else 0
-                ),
-                "locate": (
-                    self.gateway.services.get("locate", 0)
-                    if hasattr(self.gateway, "services")
-                    else 0
-                ),
+                name: services.get(name, 0)
+                for name in ("tell", "channel", "who", "finger", "locate")
             }
 
         # Log request
@@ -107,6 +94,8 @@ class StatusHandler(BaseHandler):
 class StatsHandler(BaseHandler):
     """Handler for getting performance statistics."""
 
+    __slots__ = ()
+
     def get_optional_params(self) -> list[str]:
         """Get optional parameters."""
         return ["detailed"]
@@ -196,6 +185,8 @@ class StatsHandler(BaseHandler):
 class PingHandler(BaseHandler):
     """Handler for ping/heartbeat checks."""
 
+    __slots__ = ()
+
     def validate_params(self, params: Dict[str, Any]) -> bool:
         """Validate ping parameters."""
         # No parameters required
@@ -233,6 +224,8 @@ class PingHandler(BaseHandler):
 class ReconnectHandler(BaseHandler):
     """Handler for forcing gateway reconnection."""
 
+    __slots__ = ()
+
     def validate_params(self, params: Dict[str, Any]) -> bool:
         """Validate reconnect parameters."""
         # No parameters required
@@ -290,6 +283,8 @@ class ReconnectHandler(BaseHandler):
 class ShutdownHandler(BaseHandler):
     """Handler for graceful shutdown."""
 
+    __slots__ = ()
+
     def get_optional_params(self) -> list[str]:
         """Get optional parameters."""
         return ["delay", "reason"]
@@ -332,7 +327,9 @@ class ShutdownHandler(BaseHandler):
         await self.log_request(session, "shutdown", params, True, None)
 
         # Schedule shutdown
-        asyncio.create_task(self._perform_shutdown(delay, reason))
+        task = asyncio.create_task(self._perform_shutdown(delay, reason))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
 
         return {
             "status": "scheduled",
@@ -365,6 +362,8 @@ class ShutdownHandler(BaseHandler):
 class ReloadConfigHandler(BaseHandler):
     """Handler for reloading configuration."""
 
+    __slots__ = ()
+
     def validate_params(self, params: Dict[str, Any]) -> bool:
         """Validate reload config parameters."""
         # No parameters required
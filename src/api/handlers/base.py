@@ -16,6 +16,8 @@ logger = get_logger(__name__)
 class BaseHandler(ABC):
     """Base class for API handlers."""
 
+    __slots__ = ("_required_keys", "_required_params", "gateway")
+
     def __init__(self, gateway=None):
         """Initialize handler.
 
@@ -23,6 +25,10 @@ class BaseHandler(ABC):
             gateway: Gateway instance for I3 network communication
         """
         self.gateway = gateway
+        # Required params are fixed per handler class; resolve them once
+        # instead of building a fresh list on every request.
+        self._required_params = tuple(self.get_required_params())
+        self._required_keys = frozenset(self._required_params)
 
     @abstractmethod
     async def handle(self, session: Session, params: Dict[str, Any]) -> Any:
@@ -63,6 +69,27 @@ class BaseHandler(ABC):
         """
         return session.has_permission(permission)
 
+    def authorize(
+        self, session: Session, permission: str, params: dict[str, Any], denied_message: str
+    ) -> None:
+        """Check permission and parameters for a request in one call.
+
+        Args:
+            session: Client session
+            permission: Permission the request needs
+            params: Request parameters
+            denied_message: Error message used when the permission is missing
+
+        Raises:
+            PermissionError: If session lacks permission
+            ValueError: If parameters are invalid
+        """
+        if not self.check_permission(session, permission):
+            raise PermissionError(denied_message)
+
+        if not self.validate_params(params):
+            raise ValueError("Invalid parameters")
+
     def get_required_params(self) -> list[str]:
         """Get list of required parameters.
 
@@ -91,7 +118,12 @@ class BaseHandler(ABC):
         if params is None:
             params = {}
 
-        for param in self.get_required_params():
+        # One C-level subset test covers the common case; walk the names
+        # only to report which one is missing.
+        if params.keys() >= self._required_keys:
+            return True
+
+        for param in self._required_params:
             if param not in params:
                 logger.warning(f"Missing required parameter: {param}")
                 return False
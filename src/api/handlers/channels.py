@@ -17,6 +17,8 @@ logger = get_logger(__name__)
 class ChannelJoinHandler(BaseHandler):
     """Handler for joining a channel."""
 
+    __slots__ = ()
+
     def get_required_params(self) -> list[str]:
         """Get required parameters."""
         return ["channel"]
@@ -53,13 +55,7 @@ class ChannelJoinHandler(BaseHandler):
         Returns:
             Response data
         """
-        # Check permission
-        if not self.check_permission(session, "channel"):
-            raise PermissionError("No permission for channel operations")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "channel", params, "No permission for channel operations")
 
         channel = params["channel"]
         listen_only = params.get("listen_only", False)
@@ -113,6 +109,8 @@ class ChannelJoinHandler(BaseHandler):
 class ChannelLeaveHandler(BaseHandler):
     """Handler for leaving a channel."""
 
+    __slots__ = ()
+
     def get_required_params(self) -> list[str]:
         """Get required parameters."""
         return ["channel"]
@@ -143,13 +141,7 @@ class ChannelLeaveHandler(BaseHandler):
         Returns:
             Response data
         """
-        # Check permission
-        if not self.check_permission(session, "channel"):
-            raise PermissionError("No permission for channel operations")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "channel", params, "No permission for channel operations")
 
         channel = params["channel"]
         user_name = params.get("user_name", "System")
@@ -200,6 +192,8 @@ class ChannelLeaveHandler(BaseHandler):
 class ChannelListHandler(BaseHandler):
     """Handler for listing available channels."""
 
+    __slots__ = ()
+
     def get_optional_params(self) -> list[str]:
         """Get optional parameters."""
         return ["refresh", "filter"]
@@ -229,13 +223,7 @@ class ChannelListHandler(BaseHandler):
         Returns:
             Response data with channel list
         """
-        # Check permission
-        if not self.check_permission(session, "channel"):
-            raise PermissionError("No permission for channel operations")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "channel", params, "No permission for channel operations")
 
         params = params or {}
         refresh = params.get("refresh", False)
@@ -339,6 +327,8 @@ class ChannelListHandler(BaseHandler):
 class ChannelWhoHandler(BaseHandler):
     """Handler for listing channel members."""
 
+    __slots__ = ()
+
     def get_required_params(self) -> list[str]:
         """Get required parameters."""
         return ["channel"]
@@ -365,13 +355,7 @@ class ChannelWhoHandler(BaseHandler):
         Returns:
             Response data with channel members
         """
-        # Check permission
-        if not self.check_permission(session, "channel"):
-            raise PermissionError("No permission for channel operations")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "channel", params, "No permission for channel operations")
 
         channel = params["channel"]
 
@@ -410,6 +394,8 @@ class ChannelWhoHandler(BaseHandler):
 class ChannelHistoryHandler(BaseHandler):
     """Handler for getting channel message history."""
 
+    __slots__ = ()
+
     def get_required_params(self) -> list[str]:
         """Get required parameters."""
         return ["channel"]
@@ -447,13 +433,7 @@ class ChannelHistoryHandler(BaseHandler):
         Returns:
             Response data with channel history
         """
-        # Check permission
-        if not self.check_permission(session, "channel"):
-            raise PermissionError("No permission for channel operations")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "channel", params, "No permission for channel operations")
 
         channel = params["channel"]
         limit = params.get("limit", 50)
@@ -17,6 +17,8 @@ logger = get_logger(__name__)
 class TellHandler(BaseHandler):
     """Handler for sending direct messages (tells)."""
 
+    __slots__ = ()
+
     def get_required_params(self) -> list[str]:
         """Get required parameters."""
         return ["target_mud", "target_user", "message"]
@@ -57,13 +59,7 @@ class TellHandler(BaseHandler):
         Returns:
             Response data
         """
-        # Check permission
-        if not self.check_permission(session, "tell"):
-            raise PermissionError("No permission for tell")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "tell", params, "No permission for tell")
 
         # Create tell packet
         packet = TellPacket(
@@ -96,6 +92,8 @@ class TellHandler(BaseHandler):
 class EmoteToHandler(BaseHandler):
     """Handler for sending emotes to specific users."""
 
+    __slots__ = ()
+
     def get_required_params(self) -> list[str]:
         """Get required parameters."""
         return ["target_mud", "target_user", "emote"]
@@ -126,13 +124,7 @@ class EmoteToHandler(BaseHandler):
         Returns:
             Response data
         """
-        # Check permission
-        if not self.check_permission(session, "emoteto"):
-            raise PermissionError("No permission for emoteto")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "emoteto", params, "No permission for emoteto")
 
         # Create emoteto packet
         packet = EmotetoPacket(
@@ -164,6 +156,8 @@ class EmoteToHandler(BaseHandler):
 class ChannelSendHandler(BaseHandler):
     """Handler for sending channel messages."""
 
+    __slots__ = ()
+
     def get_required_params(self) -> list[str]:
         """Get required parameters."""
         return ["channel", "message"]
@@ -199,13 +193,7 @@ class ChannelSendHandler(BaseHandler):
         Returns:
             Response data
         """
-        # Check permission
-        if not self.check_permission(session, "channel"):
-            raise PermissionError("No permission for channel messages")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "channel", params, "No permission for channel messages")
 
         # Check if subscribed to channel
         channel = params["channel"]
@@ -247,6 +235,8 @@ class ChannelSendHandler(BaseHandler):
 class ChannelEmoteHandler(BaseHandler):
     """Handler for sending channel emotes."""
 
+    __slots__ = ()
+
     def get_required_params(self) -> list[str]:
         """Get required parameters."""
         return ["channel", "emote"]
@@ -282,13 +272,7 @@ class ChannelEmoteHandler(BaseHandler):
         Returns:
             Response data
         """
-        # Check permission
-        if not self.check_permission(session, "channel"):
-            raise PermissionError("No permission for channel emotes")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "channel", params, "No permission for channel emotes")
 
         # Check if subscribed to channel
         channel = params["channel"]
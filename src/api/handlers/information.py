@@ -17,6 +17,8 @@ logger = get_logger(__name__)
 class WhoHandler(BaseHandler):
     """Handler for listing users on a MUD."""
 
+    __slots__ = ()
+
     def get_required_params(self) -> list[str]:
         """Get required parameters."""
         return ["target_mud"]
@@ -54,13 +56,7 @@ class WhoHandler(BaseHandler):
         Returns:
             Response data with user list
         """
-        # Check permission
-        if not self.check_permission(session, "info"):
-            raise PermissionError("No permission for who queries")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "info", params, "No permission for who queries")
 
         target_mud = params["target_mud"]
 
@@ -148,6 +144,8 @@ class WhoHandler(BaseHandler):
 class FingerHandler(BaseHandler):
     """Handler for getting user information."""
 
+    __slots__ = ()
+
     def get_required_params(self) -> list[str]:
         """Get required parameters."""
         return ["target_mud"]  # target_user or username checked in validate_params
@@ -183,13 +181,7 @@ class FingerHandler(BaseHandler):
         Returns:
             Response data with user information
         """
-        # Check permission
-        if not self.check_permission(session, "info"):
-            raise PermissionError("No permission for finger queries")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "info", params, "No permission for finger queries")
 
         target_mud = params["target_mud"]
         target_user = params["target_user"]
@@ -233,6 +225,8 @@ class FingerHandler(BaseHandler):
 class LocateHandler(BaseHandler):
     """Handler for locating a user on the network."""
 
+    __slots__ = ()
+
     def get_required_params(self) -> list[str]:
         """Get required parameters."""
         return ["target_user"]
@@ -259,13 +253,7 @@ class LocateHandler(BaseHandler):
         Returns:
             Response data with user location
         """
-        # Check permission
-        if not self.check_permission(session, "info"):
-            raise PermissionError("No permission for locate queries")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "info", params, "No permission for locate queries")
 
         target_user = params["target_user"]
 
@@ -311,6 +299,8 @@ class LocateHandler(BaseHandler):
 class MudListHandler(BaseHandler):
     """Handler for getting list of MUDs on the network."""
 
+    __slots__ = ()
+
     def get_optional_params(self) -> list[str]:
         """Get optional parameters."""
         return ["refresh", "filter"]
@@ -340,13 +330,7 @@ class MudListHandler(BaseHandler):
         Returns:
             Response data with MUD list
         """
-        # Check permission
-        if not self.check_permission(session, "info"):
-            raise PermissionError("No permission for mudlist queries")
-
-        # Validate parameters
-        if not self.validate_params(params):
-            raise ValueError("Invalid parameters")
+        self.authorize(session, "info", params, "No permission for mudlist queries")
 
         params = params or {}
         refresh = params.get("refresh", False)
@@ -5,15 +5,70 @@ according to the JSON-RPC 2.0 specification.
 """
 
 import json
+import re
 import uuid
 from dataclasses import dataclass, field
 from enum import IntEnum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
 from src.utils.logging import get_logger
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "speed" extra
+    orjson = None
+
 logger = get_logger(__name__)
 
+# Python types accepted for each schema "type"; unknown types allow any value
+_SCHEMA_TYPES: dict[str, type | tuple[type, ...]] = {
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
+
+# orjson only handles 64-bit integers: wider ones parse as floats. Any number
+# this long may be out of range, so such documents go to json.loads instead.
+_LONG_NUMBER = re.compile(r"\d{19,}")
+
+
+if orjson is not None:
+
+    def _json_loads(data: str) -> Any:
+        """Parse with orjson, matching json.loads for wide ints and NaN/Infinity."""
+        if _LONG_NUMBER.search(data):
+            return json.loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # json.loads accepts the NaN/Infinity literals orjson rejects, and
+            # raises json.JSONDecodeError for anything actually malformed.
+            return json.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize with orjson, returning text like json.dumps."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # Integers wider than 64 bits, among others
+            return json.dumps(obj)
+
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+
+@lru_cache(maxsize=128)
+def _error_json(code: int, message: str) -> str:
+    """Serialize an error object; servers send the same code/message pairs repeatedly."""
+    return _json_dumps({"code": code, "message": message})
+
 
 class JSONRPCError(IntEnum):
     """Standard JSON-RPC 2.0 error codes."""
@@ -32,7 +87,7 @@ class JSONRPCError(IntEnum):
     GATEWAY_ERROR = -32004  # Gateway communication error
 
 
-@dataclass
+@dataclass(slots=True)
 class JSONRPCRequest:
     """Parsed JSON-RPC request."""
 
@@ -46,7 +101,7 @@ class JSONRPCRequest:
         return self.id is None
 
 
-@dataclass
+@dataclass(slots=True)
 class JSONRPCResponse:
     """JSON-RPC response."""
 
@@ -55,24 +110,23 @@ class JSONRPCResponse:
     result: Optional[Any] = None
     error: Optional[Dict[str, Any]] = None
 
-    def to_json(self) -> str:
-        """Convert to JSON string."""
-        data = {"jsonrpc": self.jsonrpc}
-
-        if self.id is not None:
-            data["id"] = self.id
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        if self.id is None:
+            if self.error is not None:
+                return {"jsonrpc": self.jsonrpc, "error": self.error}
+            return {"jsonrpc": self.jsonrpc, "result": self.result}
 
         if self.error is not None:
-            data["error"] = self.error
-        elif self.result is not None:
-            data["result"] = self.result
-        else:
-            data["result"] = None
+            return {"jsonrpc": self.jsonrpc, "id": self.id, "error": self.error}
+        return {"jsonrpc": self.jsonrpc, "id": self.id, "result": self.result}
 
-        return json.dumps(data)
+    def to_json(self) -> str:
+        """Convert to JSON string."""
+        return _json_dumps(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class JSONRPCBatch:
     """Batch of JSON-RPC requests."""
 
@@ -107,7 +161,7 @@ class JSONRPCProtocol:
             ValueError: If request is invalid
         """
         try:
-            parsed = json.loads(data)
+            parsed = _json_loads(data)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
 
@@ -155,7 +209,7 @@ class JSONRPCProtocol:
         # Validate id (optional for notifications)
         request_id = data.get("id")
         if request_id is not None:
-            if not isinstance(request_id, (str, int, type(None))):
+            if not isinstance(request_id, (str, int)):
                 raise ValueError("ID must be a string, number, or null")
 
         return JSONRPCRequest(jsonrpc=jsonrpc, method=method, params=params, id=request_id)
@@ -209,8 +263,7 @@ class JSONRPCProtocol:
             # No response for notifications
             return ""
 
-        response = JSONRPCResponse(id=request_id, result=result)
-        return response.to_json()
+        return f'{{"jsonrpc":"2.0","id":{_json_dumps(request_id)},"result":{_json_dumps(result)}}}'
 
     def format_error(
         self,
@@ -230,11 +283,16 @@ class JSONRPCProtocol:
         Returns:
             JSON string
         """
-        error = {"code": code, "message": message}
-
-        if data is not None:
-            error["data"] = data
-
+        if data is None:
+            # Splice the cached error object in rather than re-serializing it
+            if request_id is None:
+                return f'{{"jsonrpc":"2.0","error":{_error_json(code, message)}}}'
+            return (
+                f'{{"jsonrpc":"2.0","id":{_json_dumps(request_id)},'
+                f'"error":{_error_json(code, message)}}}'
+            )
+
+        error = {"code": code, "message": message, "data": data}
         response = JSONRPCResponse(id=request_id, error=error)
         return response.to_json()
 
@@ -248,12 +306,12 @@ class JSONRPCProtocol:
             JSON string
         """
         # Filter out empty responses (from notifications)
-        valid_responses = [json.loads(r.to_json()) for r in responses if r.id is not None]
+        valid_responses = [r.to_dict() for r in responses if r.id is not None]
 
         if not valid_responses:
             return ""  # No response for all-notification batch
 
-        return json.dumps(valid_responses)
+        return _json_dumps(valid_responses)
 
     def validate_params(
         self, params: Optional[Union[Dict[str, Any], List[Any]]], schema: Dict[str, Any]
@@ -301,24 +359,12 @@ class JSONRPCProtocol:
         Returns:
             True if valid, False otherwise
         """
-        expected_type = schema.get("type")
-
-        if expected_type == "string":
-            return isinstance(value, str)
-        if expected_type == "number":
-            return isinstance(value, (int, float))
-        if expected_type == "integer":
-            return isinstance(value, int)
-        if expected_type == "boolean":
-            return isinstance(value, bool)
-        if expected_type == "array":
-            return isinstance(value, list)
-        if expected_type == "object":
-            return isinstance(value, dict)
-        if expected_type == "null":
-            return value is None
-
-        return True  # Unknown type, allow it
+        schema_type = schema.get("type")
+        if not isinstance(schema_type, str):
+            return True
+
+        expected_type = _SCHEMA_TYPES.get(schema_type)
+        return expected_type is None or isinstance(value, expected_type)
 
     def create_notification(self, method: str, params: Optional[Dict[str, Any]] = None) -> str:
         """Create a JSON-RPC notification (no response expected).
@@ -335,7 +381,7 @@ class JSONRPCProtocol:
         if params is not None:
             notification["params"] = params
 
-        return json.dumps(notification)
+        return _json_dumps(notification)
 
     def create_request(
         self,
@@ -361,4 +407,4 @@ class JSONRPCProtocol:
         if params is not None:
             request["params"] = params
 
-        return json.dumps(request)
+        return _json_dumps(request)
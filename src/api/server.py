@@ -146,6 +146,9 @@ class APIServer:
         if self.runner:
             await self.runner.cleanup()
 
+        # Cancel background handler work such as a pending reconnect
+        await self.handlers.shutdown()
+
         # Cleanup sessions
         await self.session_manager.cleanup()
 
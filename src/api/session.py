@@ -220,7 +220,9 @@ class Session:
         Returns:
             True if has permission, False otherwise
         """
-        return "*" in self.permissions or permission in self.permissions
+        # Sessions usually hold the exact permission, so probe for it first
+        permissions = self.permissions
+        return permission in permissions or "*" in permissions
 
     def subscribe(self, channel: str):
         """Subscribe to a channel.
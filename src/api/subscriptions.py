@@ -116,23 +116,20 @@ class SubscriptionManager:
             True if subscribed, False if already subscribed
         """
         # Initialize session subscriptions if needed
-        if session_id not in self.channel_subscriptions:
-            self.channel_subscriptions[session_id] = {}
+        session_channels = self.channel_subscriptions.setdefault(session_id, {})
 
         # Check if already subscribed
-        if channel_name in self.channel_subscriptions[session_id]:
+        if channel_name in session_channels:
             logger.debug(f"Session {session_id} already subscribed to {channel_name}")
             return False
 
         # Create subscription
         subscription = ChannelSubscription(channel_name=channel_name, listen_only=listen_only)
 
-        self.channel_subscriptions[session_id][channel_name] = subscription
+        session_channels[channel_name] = subscription
 
         # Add to channel members
-        if channel_name not in self.channel_members:
-            self.channel_members[channel_name] = set()
-        self.channel_members[channel_name].add(session_id)
+        self.channel_members.setdefault(channel_name, set()).add(session_id)
 
         # Update stats
         self.stats["total_subscriptions"] += 1
@@ -152,27 +149,25 @@ class SubscriptionManager:
         Returns:
             True if unsubscribed, False if not subscribed
         """
-        # Check if session has subscriptions
-        if session_id not in self.channel_subscriptions:
-            return False
-
         # Check if subscribed to channel
-        if channel_name not in self.channel_subscriptions[session_id]:
+        session_channels = self.channel_subscriptions.get(session_id)
+        if not session_channels or channel_name not in session_channels:
             return False
 
         # Remove subscription
-        del self.channel_subscriptions[session_id][channel_name]
+        del session_channels[channel_name]
 
         # Remove from channel members
-        if channel_name in self.channel_members:
-            self.channel_members[channel_name].discard(session_id)
+        members = self.channel_members.get(channel_name)
+        if members is not None:
+            members.discard(session_id)
 
             # Clean up empty channel
-            if not self.channel_members[channel_name]:
+            if not members:
                 del self.channel_members[channel_name]
 
         # Clean up empty session
-        if not self.channel_subscriptions[session_id]:
+        if not session_channels:
             del self.channel_subscriptions[session_id]
 
         # Update stats
@@ -136,7 +136,7 @@ class TCPConnection:
                                 "session_id": self.session.session_id,
                             },
                         )
-                        await self.send_json(json.loads(response))
+                        await self.send_text(response)
 
                         logger.info(
                             f"TCP connection from {self.remote_address} "
@@ -156,13 +156,13 @@ class TCPConnection:
                         response = self.protocol.format_error(
                             data.get("id"), JSONRPCError.NOT_AUTHENTICATED, str(e)
                         )
-                        await self.send_json(json.loads(response))
+                        await self.send_text(response)
                 else:
                     # Missing API key
                     response = self.protocol.format_error(
                         data.get("id"), JSONRPCError.INVALID_PARAMS, "Missing api_key parameter"
                     )
-                    await self.send_json(json.loads(response))
+                    await self.send_text(response)
 
             elif self.session:
                 # Process authenticated request
@@ -177,7 +177,7 @@ class TCPConnection:
                     response = self.protocol.format_error(
                         request.id, JSONRPCError.RATE_LIMIT_EXCEEDED, "Rate limit exceeded"
                     )
-                    await self.send_json(json.loads(response))
+                    await self.send_text(response)
                     return
 
                 # Route to appropriate handler
@@ -188,7 +188,7 @@ class TCPConnection:
                         JSONRPCError.METHOD_NOT_FOUND,
                         f"Unknown method: {request.method}",
                     )
-                    await self.send_json(json.loads(response))
+                    await self.send_text(response)
                     return
 
                 # Execute handler
@@ -200,7 +200,7 @@ class TCPConnection:
                     response = self.protocol.format_error(
                         request.id, JSONRPCError.INTERNAL_ERROR, str(e)
                     )
-                await self.send_json(json.loads(response))
+                await self.send_text(response)
 
             else:
                 # Not authenticated
@@ -209,15 +209,15 @@ class TCPConnection:
                     JSONRPCError.NOT_AUTHENTICATED,
                     "Not authenticated. Please authenticate first.",
                 )
-                await self.send_json(json.loads(response))
+                await self.send_text(response)
 
         except json.JSONDecodeError:
             response = self.protocol.format_error(None, JSONRPCError.PARSE_ERROR, "Invalid JSON")
-            await self.send_json(json.loads(response))
+            await self.send_text(response)
         except Exception as e:
             logger.error(f"Error processing TCP message: {e}")
             response = self.protocol.format_error(None, JSONRPCError.INTERNAL_ERROR, str(e))
-            await self.send_json(json.loads(response))
+            await self.send_text(response)
 
     async def send_json(self, data: Dict):
         """Send JSON data to client.
@@ -228,10 +228,20 @@ class TCPConnection:
         if self.closed:
             return
 
+        await self.send_text(json.dumps(data))
+
+    async def send_text(self, message: str) -> None:
+        """Send an already serialized JSON message to client.
+
+        Args:
+            message: JSON text; empty for notifications, which get no reply
+        """
+        if self.closed or not message:
+            return
+
         try:
-            # Convert to JSON and add newline delimiter
-            message = json.dumps(data) + "\n"
-            self.writer.write(message.encode("utf-8"))
+            # Add newline delimiter
+            self.writer.write((message + "\n").encode("utf-8"))
             await self.writer.drain()
         except Exception as e:
             logger.error(f"Error sending to TCP client: {e}")
@@ -356,6 +366,8 @@ class TCPServer:
             self.server.close()
             await self.server.wait_closed()
 
+        await self.handlers.shutdown()
+
         logger.info("TCP server stopped")
 
     def get_connection_count(self) -> int:
@@ -4,6 +4,7 @@ This module defines data structures for tracking MUD information,
 channel state, and user sessions.
 """
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -218,6 +219,8 @@ class UserSession:
     # Session state
     created_at: datetime = field(default_factory=datetime.now)
     last_activity: datetime = field(default_factory=datetime.now)
+    # Derived from last_activity whenever it is assigned; see __setattr__
+    last_activity_monotonic: float = field(init=False, compare=False)
     presence_updated_at: datetime = field(default_factory=datetime.now)
     is_online: bool = True
 
@@ -242,6 +245,13 @@ class UserSession:
     messages_sent: int = 0
     messages_received: int = 0
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Keep last_activity_monotonic in step with every last_activity update."""
+        super().__setattr__(name, value)
+        if name == "last_activity":
+            idle = (datetime.now() - value).total_seconds()
+            super().__setattr__("last_activity_monotonic", time.monotonic() - idle)
+
     def update_activity(self):
         """Update last activity timestamp."""
         self.last_activity = datetime.now()
@@ -3,10 +3,12 @@
 This module defines the packet structures used in the Intermud-3 protocol.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, NamedTuple
 
 
 class PacketValidationError(Exception):
@@ -479,6 +481,88 @@ class ChannelMessagePacket(I3Packet):
         )
 
 
+@dataclass(frozen=True, slots=True)
+class WhoEntry:
+    """One online user in a locally built who reply.
+
+    Entries are immutable so cached replies can share them; replies expose
+    them as dicts through who_data. Supports read-only mapping-style access
+    (``entry["name"]``) like that dict form; race and guild only count as
+    present when set.
+    """
+
+    name: str
+    idle: int
+    level: int
+    extra: str
+    race: str = ""
+    guild: str = ""
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a present field by name, raising KeyError otherwise."""
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if key names a present field."""
+        if key in ("race", "guild"):
+            return bool(getattr(self, key))
+        return key in ("name", "idle", "level", "extra")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by name, or default if absent."""
+        return getattr(self, key) if key in self else default
+
+    def to_dict(self) -> dict[str, Any]:
+        """Materialize the dict form used by who_data consumers."""
+        data: dict[str, Any] = {
+            "name": self.name,
+            "idle": self.idle,
+            "level": self.level,
+            "extra": self.extra,
+        }
+        if self.race:
+            data["race"] = self.race
+        if self.guild:
+            data["guild"] = self.guild
+        return data
+
+    def to_row(self) -> list[Any]:
+        """Build the [name, idle, extra] who-reply row."""
+        extra = self.extra
+        if self.level > 0:
+            extra = f"Level {self.level}" + (f" - {extra}" if extra else "")
+        return [self.name, self.idle, extra]
+
+
+class WhoFilters(NamedTuple):
+    """Who request filters in a fixed layout; None leaves a filter unset."""
+
+    level_min: int | None = None
+    level_max: int | None = None
+    race: str | None = None
+    guild: str | None = None
+
+    @classmethod
+    def from_criteria(cls, filter_criteria: dict[str, Any] | None) -> "WhoFilters":
+        """Build filters from a who request's filter_criteria mapping.
+
+        Args:
+            filter_criteria: Optional filter criteria; unknown keys are ignored
+
+        Returns:
+            The filters present in filter_criteria
+        """
+        if not filter_criteria:
+            return _NO_WHO_FILTERS
+        get = filter_criteria.get
+        return cls(get("level_min"), get("level_max"), get("race"), get("guild"))
+
+
+_NO_WHO_FILTERS = WhoFilters()
+
+
 @dataclass
 class WhoPacket(I3Packet):
     """Who request/reply packet."""
@@ -489,6 +573,85 @@ class WhoPacket(I3Packet):
     # For who-reply
     who_data: list[dict[str, Any]] | None = None
 
+    # Pre-built wire rows for who_data, shared by replies served from a cache
+    who_rows: list[list[Any]] | None = field(default=None, repr=False, compare=False)
+
+    # Sorted, interned (key, value) pairs of filter_criteria for cache lookups
+    filter_key: tuple[Any, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    # filter_criteria in fixed-field form for matching sessions
+    filters: WhoFilters = field(default=_NO_WHO_FILTERS, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive the filter key and filters, then validate."""
+        self.filter_key = self.make_filter_key(self.filter_criteria)
+        self.filters = WhoFilters.from_criteria(self.filter_criteria)
+        super().__post_init__()
+
+    @classmethod
+    def reply_to(
+        cls,
+        request: "WhoPacket",
+        who_data: Iterable[dict[str, Any] | WhoEntry],
+        originator_mud: str,
+        who_rows: list[list[Any]] | None = None,
+    ) -> "WhoPacket":
+        """Build a who-reply addressed to the sender of a request.
+
+        Bypasses __init__ and validation: the addressing comes from an
+        already validated request and who_data is always supplied.
+        WhoEntry objects are converted to their dict form.
+
+        Args:
+            request: The who request being answered
+            who_data: User entries for the reply
+            originator_mud: Name of the replying MUD
+            who_rows: Optional pre-built wire rows for who_data
+
+        Returns:
+            Who reply packet
+        """
+        packet = object.__new__(cls)
+        packet.packet_type = PacketType.WHO_REPLY
+        packet.ttl = 200
+        packet.originator_mud = originator_mud
+        packet.originator_user = ""
+        packet.target_mud = request.originator_mud
+        packet.target_user = request.originator_user
+        packet.filter_criteria = None
+        packet.who_data = [
+            user.to_dict() if isinstance(user, WhoEntry) else user for user in who_data
+        ]
+        packet.who_rows = who_rows
+        packet.filter_key = ()
+        packet.filters = _NO_WHO_FILTERS
+        return packet
+
+    @staticmethod
+    def make_filter_key(filter_criteria: dict[str, Any] | None) -> tuple[Any, ...]:
+        """Build a sorted tuple key from filter criteria.
+
+        Args:
+            filter_criteria: Optional who filter criteria
+
+        Returns:
+            Tuple of (key, value) pairs with string parts interned
+        """
+        if not filter_criteria:
+            return ()
+        return tuple(
+            sorted(
+                (
+                    (
+                        sys.intern(key) if isinstance(key, str) else key,
+                        sys.intern(value) if isinstance(value, str) else value,
+                    )
+                    for key, value in filter_criteria.items()
+                ),
+                key=lambda item: str(item[0]),
+            )
+        )
+
     def validate(self) -> None:
         """Validate who packet."""
         super().validate()
@@ -514,11 +677,30 @@ class WhoPacket(I3Packet):
         if self.packet_type == PacketType.WHO_REQ:
             # The I3 who-req packet has exactly the six common fields.
             # Filtering is a local API feature and has no standard wire field.
-            return base
-
-        users: list[list[Any]] = []
-        for user in self.who_data or []:
-            if isinstance(user, dict):
+            return base
+
+        users = self.who_rows if self.who_rows is not None else self.encode_who_data(self.who_data)
+        base.append(users)
+        return base
+
+    @staticmethod
+    def encode_who_data(
+        who_data: Iterable[dict[str, Any] | WhoEntry] | None,
+    ) -> list[list[Any]]:
+        """Convert who_data entries to I3 who-reply rows.
+
+        Args:
+            who_data: User entries as WhoEntry objects, mappings or
+                [name, idle, extra] sequences
+
+        Returns:
+            List of [name, idle, extra] rows
+        """
+        users: list[list[Any]] = []
+        for user in who_data or []:
+            if isinstance(user, WhoEntry):
+                users.append(user.to_row())
+            elif isinstance(user, dict):
                 name = user.get("name", user.get("visname", ""))
                 idle = user.get("idle", user.get("idle_time", 0))
                 extra = user.get("extra", user.get("title", ""))
@@ -537,11 +719,10 @@ class WhoPacket(I3Packet):
                 except (TypeError, ValueError):
                     idle = 0
                 users.append([str(name or ""), idle, str(extra or "")])
-            elif isinstance(user, (list, tuple)) and len(user) >= 3:
-                users.append([user[0], user[1], user[2]])
-
-        base.append(users)
-        return base
+            elif isinstance(user, (list, tuple)) and len(user) >= 3:
+                users.append([user[0], user[1], user[2]])
+
+        return users
 
     @classmethod
     def from_lpc_array(cls, data: list[Any]) -> "WhoPacket":
@@ -557,7 +738,7 @@ class WhoPacket(I3Packet):
             )
 
         filter_criteria = None
-        who_data = None
+        who_data: list[dict[str, Any]] | None = None
         if packet_type == PacketType.WHO_REQ and len(data) > 6:
             filter_criteria = data[6] if isinstance(data[6], dict) else {}
         elif packet_type == PacketType.WHO_REPLY:
@@ -6,7 +6,7 @@ and forwarding packets to the correct destination.
 
 import structlog
 
-from ..models.packet import I3Packet
+from ..models.packet import ErrorPacket, I3Packet
 from .base import BaseService
 
 
@@ -201,8 +201,6 @@ class RouterService(BaseService):
             self.logger.warning("Cannot send error reply without gateway")
             return
 
-        from ..models.packet import ErrorPacket
-
         error_packet = ErrorPacket(
             ttl=200,
             originator_mud=self.gateway.settings.mud.name,
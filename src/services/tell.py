@@ -4,7 +4,7 @@ This service handles tell and emoteto packets for private
 communication between users on different MUDs.
 """
 
-import asyncio
+import time
 
 import structlog
 
@@ -113,7 +113,7 @@ class TellService(BaseService):
                 "from_user": packet.originator_user,
                 "visname": packet.visname,  # Direct access - TellPacket ALWAYS has visname per I3 spec
                 "message": packet.message,
-                "timestamp": asyncio.get_event_loop().time(),
+                "timestamp": time.monotonic(),
             }
         )
 
@@ -189,6 +189,19 @@ class TellService(BaseService):
     async def validate_packet(self, packet: I3Packet) -> bool:
         """Validate a tell/emoteto packet.
 
+        Args:
+            packet: The packet to validate
+
+        Returns:
+            True if packet is valid
+        """
+        return self.check_packet(packet)
+
+    def check_packet(self, packet: I3Packet) -> bool:
+        """Synchronously validate a tell/emoteto packet.
+
+        validate_packet() only wraps this check, which performs no I/O.
+
         Args:
             packet: The packet to validate
 
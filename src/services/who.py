@@ -4,14 +4,131 @@ This service handles who-req and who-reply packets to provide
 information about users currently online on a MUD.
 """
 
-from datetime import datetime
+import asyncio
+import operator
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 import structlog
 
-from ..models.packet import I3Packet, PacketType, WhoPacket
+from ..models.connection import UserSession
+from ..models.packet import I3Packet, PacketType, WhoEntry, WhoFilters, WhoPacket
+from ..state.manager import StateManager
 from .base import BaseService
 
+# Session attribute and the comparison a session must pass, per WhoFilters field
+_FILTER_CHECKS: tuple[tuple[str, Callable[[Any, Any], bool]], ...] = (
+    ("level", operator.ge),  # level_min
+    ("level", operator.le),  # level_max
+    ("race", operator.eq),  # race
+    ("guild", operator.eq),  # guild
+)
+
+
+@lru_cache(maxsize=64)
+def _compile_filter(filters: WhoFilters) -> Callable[[Any], bool] | None:
+    """Build a session predicate applying only the active filter checks.
+
+    Args:
+        filters: Who filters; fields left as None are skipped
+
+    Returns:
+        Predicate over sessions, or None when no filter is active
+    """
+    checks = tuple(
+        (operator.attrgetter(attr), compare, value)
+        for (attr, compare), value in zip(_FILTER_CHECKS, filters, strict=True)
+        if value is not None
+    )
+    if not checks:
+        return None
+    if len(checks) == 1:
+        get, compare, value = checks[0]
+        return lambda session: compare(get(session), value)
+    return lambda session: all(compare(get(session), value) for get, compare, value in checks)
+
+
+def _to_filters(filter_criteria: WhoFilters | dict[str, Any] | None) -> WhoFilters:
+    """Accept either a WhoFilters or a filter_criteria mapping."""
+    if isinstance(filter_criteria, WhoFilters):
+        return filter_criteria
+    return WhoFilters.from_criteria(filter_criteria)
+
+
+def _filter_predicate(filters: WhoFilters) -> Callable[[Any], bool] | None:
+    """Return the compiled predicate for a request's filters."""
+    try:
+        return _compile_filter(filters)
+    except TypeError:
+        # Unhashable filter values cannot be cached; compile them per request
+        return _compile_filter.__wrapped__(filters)
+
+
+class OnlineIndex:
+    """Sessions kept in casefolded user name order.
+
+    Maintained incrementally from state manager session events so who
+    requests walk a pre-sorted roster instead of sorting on every call.
+    """
+
+    __slots__ = ("_key_by_id", "_keys", "_sessions")
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._keys: list[str] = []
+        self._sessions: list[UserSession] = []
+        self._key_by_id: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed sessions."""
+        return len(self._sessions)
+
+    def __iter__(self) -> Iterator[UserSession]:
+        """Iterate over sessions in name order."""
+        return iter(self._sessions)
+
+    def add(self, session: UserSession) -> None:
+        """Insert a session, or reposition it if its name changed.
+
+        Args:
+            session: Session to index
+        """
+        key = session.user_name.casefold()
+        if self._key_by_id.get(session.session_id) == key:
+            return
+
+        self.discard(session)
+        index = bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._sessions.insert(index, session)
+        self._key_by_id[session.session_id] = key
+
+    def discard(self, session: UserSession) -> None:
+        """Remove a session if it is indexed.
+
+        Args:
+            session: Session to remove
+        """
+        key = self._key_by_id.pop(session.session_id, None)
+        if key is None:
+            return
+
+        for index in range(bisect_left(self._keys, key), bisect_right(self._keys, key)):
+            if self._sessions[index].session_id == session.session_id:
+                del self._keys[index]
+                del self._sessions[index]
+                return
+
+    def clear(self) -> None:
+        """Remove all sessions."""
+        self._keys.clear()
+        self._sessions.clear()
+        self._key_by_id.clear()
+
 
 class WhoService(BaseService):
     """Service for handling who requests."""
@@ -20,6 +137,12 @@ class WhoService(BaseService):
     supported_packets = [PacketType.WHO_REQ, PacketType.WHO_REPLY]
     requires_auth = False
 
+    # Upper bound on who requests in flight during a fan-out
+    max_concurrent_requests = 16
+
+    # Accepted (packet_type, packet class) pairs for validate_packet()
+    _valid_shapes = frozenset((packet_type, WhoPacket) for packet_type in supported_packets)
+
     def __init__(self, state_manager, gateway=None):
         """Initialize who service.
 
@@ -31,15 +154,53 @@ class WhoService(BaseService):
         self.gateway = gateway
         self.logger = structlog.get_logger()
 
-        # Cache for who results
-        self.who_cache: dict[str, tuple[list[dict], float]] = {}
+        # Packet handlers by type, bound once for handle_packet()
+        self._dispatch: dict[PacketType, Callable[[Any], Awaitable[I3Packet | None]]] = {
+            PacketType.WHO_REQ: self._handle_who_request,
+            PacketType.WHO_REPLY: self._handle_who_reply,
+        }
+
+        # Cache for who results: filter key -> (who_data, wire rows, monotonic expiry)
+        self.who_cache: dict[
+            tuple[Any, ...], tuple[tuple[WhoEntry, ...], list[list[Any]], float]
+        ] = {}
         self.cache_ttl = 30.0  # 30 seconds cache
+        self.cache_maxsize = 256
+
+        # Local MUD sessions, kept sorted by the state manager's session events
+        self._local_mud_key = (gateway.settings.mud.name if gateway else "local").casefold()
+        self._online_index = OnlineIndex()
+        for session in list(state_manager.sessions.values()):
+            self.on_session_online(session)
+        state_manager.add_session_listener(self)
 
     async def initialize(self) -> None:
         """Initialize the who service."""
         await super().initialize()
         self.logger.info("Who service initialized")
 
+    async def shutdown(self) -> None:
+        """Shutdown the who service."""
+        self.state_manager.remove_session_listener(self)
+        await super().shutdown()
+
+    def on_session_online(self, session: UserSession) -> None:
+        """Index a local MUD session that came online or refreshed presence.
+
+        Args:
+            session: The session reported by the state manager
+        """
+        if session.mud_name.casefold() == self._local_mud_key:
+            self._online_index.add(session)
+
+    def on_session_offline(self, session: UserSession) -> None:
+        """Drop a session the state manager removed.
+
+        Args:
+            session: The session reported by the state manager
+        """
+        self._online_index.discard(session)
+
     async def handle_packet(self, packet: I3Packet) -> I3Packet | None:
         """Handle incoming who packet.
 
@@ -49,12 +210,10 @@ class WhoService(BaseService):
         Returns:
             Optional response packet
         """
-        if packet.packet_type == PacketType.WHO_REQ:
-            return await self._handle_who_request(packet)
-        if packet.packet_type == PacketType.WHO_REPLY:
-            return await self._handle_who_reply(packet)
-
-        return None
+        handler = self._dispatch.get(packet.packet_type)
+        if handler is None:
+            return None
+        return await handler(packet)
 
     async def _handle_who_request(self, packet: WhoPacket) -> I3Packet | None:
         """Handle a who request packet.
@@ -73,21 +232,82 @@ class WhoService(BaseService):
         )
 
         # Check cache first
-        cache_key = f"{self.gateway.settings.mud.name if self.gateway else 'local'}"
-        if cache_key in self.who_cache:
-            cached_data, cache_time = self.who_cache[cache_key]
-            if (datetime.now().timestamp() - cache_time) < self.cache_ttl:
-                self.logger.debug("Returning cached who data")
-                return self._create_who_reply(packet, cached_data)
+        cache_key = self._cache_key(packet)
+        cached = self._lookup_cache(cache_key)
+        if cached is not None:
+            self.logger.debug("Returning cached who data")
+            return self._create_who_reply(packet, *cached)
 
-        # Get online users from state manager
-        online_users = await self._get_online_users(packet.filter_criteria)
+        # Get online users and their wire rows from the online index. This
+        # never yields to the event loop, so concurrent misses cannot interleave.
+        online_users, who_rows = self._build_who_data(packet.filters)
 
-        # Cache the results
-        self.who_cache[cache_key] = (online_users, datetime.now().timestamp())
+        # Cache the results along with their wire rows
+        if cache_key is not None:
+            self._store_cache(cache_key, online_users, who_rows)
 
         # Create and return who reply
-        return self._create_who_reply(packet, online_users)
+        return self._create_who_reply(packet, online_users, who_rows)
+
+    def _lookup_cache(
+        self, cache_key: tuple[Any, ...] | None
+    ) -> tuple[tuple[WhoEntry, ...], list[list[Any]]] | None:
+        """Return unexpired cached (who_data, wire rows) for a key.
+
+        Args:
+            cache_key: Key from _cache_key()
+
+        Returns:
+            Cached who data and rows, or None on a miss
+        """
+        if cache_key is None:
+            return None
+        entry = self.who_cache.get(cache_key)
+        if entry is None:
+            return None
+        cached_data, cached_rows, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self.who_cache[cache_key]
+            return None
+        return cached_data, cached_rows
+
+    def _store_cache(
+        self, cache_key: tuple[Any, ...], who_data: tuple[WhoEntry, ...], who_rows: list[list[Any]]
+    ) -> None:
+        """Cache who data and rows, keeping at most cache_maxsize entries.
+
+        Args:
+            cache_key: Key from _cache_key()
+            who_data: Who entries to cache
+            who_rows: Wire rows built from who_data
+        """
+        now = time.monotonic()
+        self.who_cache.pop(cache_key, None)
+        if len(self.who_cache) >= self.cache_maxsize:
+            for key in [key for key, entry in self.who_cache.items() if entry[2] <= now]:
+                del self.who_cache[key]
+            # Entries are inserted in expiry order, so the first is the oldest
+            while len(self.who_cache) >= self.cache_maxsize:
+                del self.who_cache[next(iter(self.who_cache))]
+
+        self.who_cache[cache_key] = (who_data, who_rows, now + self.cache_ttl)
+
+    @staticmethod
+    def _cache_key(packet: WhoPacket) -> tuple[Any, ...] | None:
+        """Return the who cache key for a request.
+
+        Args:
+            packet: The who request packet
+
+        Returns:
+            The packet's filter key, or None if it cannot be cached
+        """
+        key = packet.filter_key
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
 
     async def _handle_who_reply(self, packet: WhoPacket) -> I3Packet | None:
         """Handle a who reply packet.
@@ -110,89 +330,90 @@ class WhoService(BaseService):
         return None
 
     async def _get_online_users(
-        self, filter_criteria: dict[str, Any] | None
-    ) -> list[dict[str, Any]]:
+        self, filters: WhoFilters | dict[str, Any] | None
+    ) -> list[WhoEntry]:
         """Get list of online users matching filter criteria.
 
         Args:
-            filter_criteria: Optional filter criteria
+            filters: Who filters, or a filter_criteria mapping
 
         Returns:
-            List of user information dictionaries
-        """
-        online_users = []
-
-        local_mud = self.gateway.settings.mud.name if self.gateway else "local"
-        sessions = await self.state_manager.get_sessions_for_mud(local_mud)
-
-        for session in sessions:
-            if not session.is_online:
-                continue
-
-            # Apply filters if provided
-            if filter_criteria:
-                # Check level filter
-                if "level_min" in filter_criteria:
-                    if session.level < filter_criteria["level_min"]:
-                        continue
-                if "level_max" in filter_criteria:
-                    if session.level > filter_criteria["level_max"]:
-                        continue
-
-                # Check race filter
-                if "race" in filter_criteria:
-                    if session.race != filter_criteria["race"]:
-                        continue
-
-                # Check guild filter
-                if "guild" in filter_criteria:
-                    if session.guild != filter_criteria["guild"]:
-                        continue
-
-            # Calculate idle time
-            idle_time = int((datetime.now() - session.last_activity).total_seconds())
-
-            # Build user info
-            user_info = {
-                "name": session.user_name,
-                "idle": idle_time,
-                "level": session.level,
-                "extra": session.title or "",
-            }
-
-            # Add optional fields if available
-            race = getattr(session, "race", "")
-            guild = getattr(session, "guild", "")
-            if isinstance(race, str) and race:
-                user_info["race"] = race
-            if isinstance(guild, str) and guild:
-                user_info["guild"] = guild
-
-            online_users.append(user_info)
-
-        # Sort by name
-        online_users.sort(key=lambda u: u["name"].lower())
-
-        return online_users
-
-    def _create_who_reply(self, request: WhoPacket, users: list[dict[str, Any]]) -> WhoPacket:
+            List of who entries in name order
+        """
+        return list(self._iter_online_users(filters))
+
+    def _build_who_data(
+        self, filters: WhoFilters | dict[str, Any] | None
+    ) -> tuple[tuple[WhoEntry, ...], list[list[Any]]]:
+        """Build who entries and their who-reply rows in a single roster pass.
+
+        The entries come back as a tuple so cache hits can share the same
+        immutable sequence; each reply builds its own who_data dicts from it.
+
+        Args:
+            filters: Who filters, or a filter_criteria mapping
+
+        Returns:
+            Tuple of (who entries, [name, idle, extra] rows) in name order
+        """
+        online_users: list[WhoEntry] = []
+        who_rows: list[list[Any]] = []
+        add_user = online_users.append
+        add_row = who_rows.append
+        for user in self._iter_online_users(filters):
+            add_user(user)
+            add_row(user.to_row())
+        return tuple(online_users), who_rows
+
+    def _iter_online_users(self, filters: WhoFilters | dict[str, Any] | None) -> Iterator[WhoEntry]:
+        """Yield who entries for online users matching filter criteria."""
+        predicate = _filter_predicate(_to_filters(filters))
+
+        # Presence snapshots expire just as in StateManager.get_sessions_for_mud.
+        # Clock reads and the entry constructor are bound once, outside the loop.
+        cutoff = datetime.now() - timedelta(seconds=StateManager.PRESENCE_TTL_SECONDS)
+        now = time.monotonic()
+        entry = WhoEntry
+
+        # The index is already in name order, so no sort is needed. Filters run
+        # as one builtin filter() pass over the roster before entries are built.
+        sessions = filter(predicate, self._online_index) if predicate else self._online_index
+
+        # UserSession always defines race and guild; "" means not supplied
+        return (
+            entry(
+                session.user_name,
+                int(now - session.last_activity_monotonic),
+                session.level,
+                session.title or "",
+                session.race,
+                session.guild,
+            )
+            for session in sessions
+            if session.is_online and session.presence_updated_at >= cutoff
+        )
+
+    def _create_who_reply(
+        self,
+        request: WhoPacket,
+        users: Iterable[dict[str, Any] | WhoEntry],
+        who_rows: list[list[Any]] | None = None,
+    ) -> WhoPacket:
         """Create a who reply packet.
 
         Args:
             request: The original who request
             users: List of user information
+            who_rows: Optional pre-built wire rows for users
 
         Returns:
             Who reply packet
         """
-        return WhoPacket(
-            packet_type=PacketType.WHO_REPLY,
-            ttl=200,
-            originator_mud=self.gateway.settings.mud.name if self.gateway else "",
-            originator_user="",
-            target_mud=request.originator_mud,
-            target_user=request.originator_user,
-            who_data=users,
+        return WhoPacket.reply_to(
+            request,
+            users,
+            self.gateway.settings.mud.name if self.gateway else "",
+            who_rows,
         )
 
     async def validate_packet(self, packet: I3Packet) -> bool:
@@ -204,16 +425,9 @@ class WhoService(BaseService):
         Returns:
             True if packet is valid
         """
-        if packet.packet_type not in self.supported_packets:
-            return False
-
-        if not isinstance(packet, WhoPacket):
-            return False
-
         # who-req doesn't require any specific fields
         # who-reply requires who_data but that's checked in the packet itself
-
-        return True
+        return (packet.packet_type, type(packet)) in self._valid_shapes
 
     async def send_who_request(
         self, target_mud: str, filter_criteria: dict[str, Any] | None = None
@@ -248,7 +462,40 @@ class WhoService(BaseService):
 
         return success
 
-    def clear_cache(self):
+    async def send_who_request_all(
+        self, target_muds: list[str], filter_criteria: dict[str, Any] | None = None
+    ) -> list[bool]:
+        """Send a who request to several MUDs concurrently.
+
+        At most max_concurrent_requests sends are in flight at once.
+
+        Args:
+            target_muds: Target MUD names
+            filter_criteria: Optional filter criteria
+
+        Returns:
+            Send result for each target MUD, in the given order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def send_one(target_mud: str) -> bool:
+            async with semaphore:
+                return await self.send_who_request(target_mud, filter_criteria)
+
+        results = await asyncio.gather(
+            *(send_one(target_mud) for target_mud in target_muds), return_exceptions=True
+        )
+
+        sent: list[bool] = []
+        for target_mud, result in zip(target_muds, results, strict=True):
+            if isinstance(result, BaseException):
+                self.logger.warning("Who request failed", target_mud=target_mud, error=str(result))
+                sent.append(False)
+            else:
+                sent.append(result)
+        return sent
+
+    def clear_cache(self) -> None:
         """Clear the who cache."""
         self.who_cache.clear()
         self.logger.debug("Who cache cleared")
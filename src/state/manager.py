@@ -117,6 +117,7 @@ class StateManager:
         self.sessions: dict[str, UserSession] = {}
         self.session_lock = asyncio.Lock()
         self.presence_snapshots: dict[str, datetime] = {}
+        self.session_listeners: list[Any] = []
 
         # Caching
         self.cache = TTLCache(default_ttl=cache_ttl)
@@ -176,6 +177,8 @@ class StateManager:
                     self.mudlist[mud_name] = mud_info
                 await self.cache.delete(f"mud:{mud_name}")
 
+            await self.cache.delete("mudlist")
+
     async def get_mud_info(self, mud_name: str) -> MudInfo | None:
         """Get information about a specific MUD.
 
@@ -286,6 +289,38 @@ class StateManager:
         """
         return await self.get_mud_info(mud_name)
 
+    def add_session_listener(self, listener: Any) -> None:
+        """Register a listener for session transitions.
+
+        Listeners provide ``on_session_online(session)`` and
+        ``on_session_offline(session)``; both are called synchronously
+        while the session lock is held.
+
+        Args:
+            listener: Object implementing the session callbacks
+        """
+        if listener not in self.session_listeners:
+            self.session_listeners.append(listener)
+
+    def remove_session_listener(self, listener: Any) -> None:
+        """Unregister a session listener.
+
+        Args:
+            listener: Previously registered listener
+        """
+        if listener in self.session_listeners:
+            self.session_listeners.remove(listener)
+
+    def _notify_session_online(self, session: UserSession) -> None:
+        """Tell listeners a session is online or had its presence refreshed."""
+        for listener in self.session_listeners:
+            listener.on_session_online(session)
+
+    def _notify_session_offline(self, session: UserSession) -> None:
+        """Tell listeners a session has been removed."""
+        for listener in self.session_listeners:
+            listener.on_session_offline(session)
+
     async def create_session(self, mud_name: str, user_name: str) -> UserSession:
         """Create a new user session.
 
@@ -301,6 +336,7 @@ class StateManager:
 
         async with self.session_lock:
             self.sessions[session_id] = session
+            self._notify_session_online(session)
 
         return session
 
@@ -326,7 +362,9 @@ class StateManager:
             session_id: Session ID
         """
         async with self.session_lock:
-            self.sessions.pop(session_id, None)
+            session = self.sessions.pop(session_id, None)
+            if session:
+                self._notify_session_offline(session)
 
     async def sync_mud_presence(
         self, mud_name: str, users: list[dict[str, Any]]
@@ -382,6 +420,7 @@ class StateManager:
                     session.login_time = None
 
                 synchronized.append(session)
+                self._notify_session_online(session)
 
             stale_session_ids = [
                 session_id
@@ -391,7 +430,7 @@ class StateManager:
                 and session_id not in active_session_ids
             ]
             for session_id in stale_session_ids:
-                del self.sessions[session_id]
+                self._notify_session_offline(self.sessions.pop(session_id))
 
             self.presence_snapshots[mud_key] = now
 
@@ -504,6 +543,8 @@ class StateManager:
                             status=MudStatus(mud_data.get("status", "unknown")),
                         )
                         self.mudlist[mud_name] = mud
+
+                await self.cache.delete("mudlist")
             except Exception as e:
                 # Log error but continue
                 print(f"Error loading mudlist: {e}")
@@ -548,7 +589,7 @@ class StateManager:
                         if session.last_activity < cutoff
                     ]
                     for session_id in expired_sessions:
-                        del self.sessions[session_id]
+                        self._notify_session_offline(self.sessions.pop(session_id))
 
             except asyncio.CancelledError:
                 break
@@ -561,10 +602,23 @@ class StateManager:
         """Get the full mudlist.
 
         Returns:
-            List of MUD information dictionaries
+            List of MUD information dictionaries, owned by the caller
+        """
+        # Dashboards poll this; reuse the built entries until the mudlist
+        # changes, handing out copies so callers cannot alter the cache.
+        cached = await self.cache.get("mudlist")
+        if cached is None:
+            cached = await self._build_mudlist()
+        return [dict(mud) for mud in cached]
+
+    async def _build_mudlist(self) -> tuple[dict[str, Any], ...]:
+        """Build and cache the mudlist entries returned by get_mudlist().
+
+        Returns:
+            Tuple of MUD information dictionaries
         """
         async with self.mudlist_lock:
-            return [
+            muds = tuple(
                 {
                     "name": mud.name,
                     "host": mud.address,
@@ -580,7 +634,9 @@ class StateManager:
                     "admin_email": mud.admin_email,
                 }
                 for mud in self.mudlist.values()
-            ]
+            )
+            await self.cache.set("mudlist", muds, ttl=60)
+            return muds
 
     async def get_channel_history(
         self, channel: str, limit: int = 50, before: str | None = None, after: str | None = None
@@ -1,13 +1,45 @@
 """Logging utilities for I3 Gateway."""
 
+import importlib
+import json
 import logging
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import structlog
 from structlog.types import Processor
 
 
+def _json_serializer() -> Callable[..., str]:
+    """Return the JSON serializer for the structlog JSON renderer.
+
+    Uses orjson when it is installed (see the "speed" extra) and falls
+    back to json.dumps otherwise.
+    """
+    try:
+        orjson = importlib.import_module("orjson")
+    except ImportError:
+        return json.dumps
+
+    def orjson_dumps(
+        obj: Any, default: Callable[[Any], Any] | None = None, sort_keys: bool = False
+    ) -> str:
+        """Serialize a log event with orjson, returning text for PrintLogger.
+
+        Only the json.dumps keywords orjson can honour are accepted, so any
+        other JSONRenderer option fails loudly instead of being dropped.
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        encoded: bytes = orjson.dumps(obj, default=default, option=option)
+        return encoded.decode()
+
+    return orjson_dumps
+
+
 def setup_logging(
     level: str = "INFO", format_type: str = "json", log_file: str | None = None
 ) -> None:
@@ -31,7 +63,7 @@ def setup_logging(
 
     # Add appropriate renderer
     if format_type == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_json_serializer()))
     else:
         processors.append(structlog.dev.ConsoleRenderer())
 
@@ -203,3 +203,41 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "slow: Tests that take a long time to run")
     config.addinivalue_line("markers", "network: Tests that require network access")
     config.addinivalue_line("markers", "asyncio: Asynchronous tests")
+    config.addinivalue_line(
+        "markers",
+        "fast_only_one: Run only the first parametrized case unless --all-combinations is given",
+    )
+
+
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--all-combinations",
+        action="store_true",
+        default=False,
+        help="Run every parametrized case of tests marked fast_only_one",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect all but one case of each fast_only_one parametrized test."""
+    if config.getoption("--all-combinations"):
+        return
+
+    seen = set()
+    selected = []
+    deselected = []
+    for item in items:
+        if item.get_closest_marker("fast_only_one") is None:
+            selected.append(item)
+            continue
+        key = (item.parent.nodeid, item.originalname)
+        if key in seen:
+            deselected.append(item)
+        else:
+            seen.add(key)
+            selected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
@@ -1,100 +1,191 @@
 """Comprehensive unit tests for TellService."""
 
-import asyncio
-from unittest.mock import AsyncMock, Mock, patch
+import copy
+from asyncio import gather
+from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import DEFAULT, AsyncMock, Mock
 
 import pytest
 
-from src.models.connection import UserSession
 from src.models.packet import (
     EmotetoPacket,
     ErrorPacket,
-    I3Packet,
     PacketType,
     PacketValidationError,
     TellPacket,
 )
+from src.services.base import ServiceMetrics
 from src.services.tell import TellService
 from src.state.manager import StateManager
 
+# Async test classes share one event loop across the module
+module_loop = pytest.mark.asyncio(loop_scope="module")
+
+# Addressing shared by every inbound tell/emoteto built in this module
+_PACKET_DEFAULTS = MappingProxyType(
+    {
+        "ttl": 200,
+        "originator_mud": "RemoteMUD",
+        "target_mud": "TestMUD",
+        "target_user": "receiver",
+    }
+)
 
-@pytest.fixture
-def mock_state_manager():
-    """Create a mock state manager."""
-    manager = Mock(spec=StateManager)
-    manager.find_user_session = AsyncMock()
-    manager.has_current_presence = AsyncMock(return_value=True)
-    return manager
 
+@pytest.fixture(scope="module")
+def mock_state_manager():
+    """Create a mock state manager shared by the module."""
+    manager = Mock(spec=StateManager)
+    manager.find_user_session = AsyncMock(return_value=None)
+    manager.has_current_presence = AsyncMock(return_value=True)
+    return manager
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_gateway():
-    """Create a mock gateway."""
-    gateway = Mock()
-    gateway.settings = Mock()
-    gateway.settings.mud = Mock()
-    gateway.settings.mud.name = "TestMUD"
-    gateway.send_packet = AsyncMock(return_value=True)
-    return gateway
+    """Create a mock gateway shared by the module that records sent packets."""
+    sent = []
+
+    def capture(packet):
+        sent.append(packet)
+        return DEFAULT
+
+    return SimpleNamespace(
+        settings=SimpleNamespace(mud=SimpleNamespace(name="TestMUD")),
+        send_packet=AsyncMock(return_value=True, side_effect=capture),
+        sent=sent,
+    )
+
+
+@pytest.fixture(scope="module")
+def tell_service_template(mock_state_manager, mock_gateway):
+    """Construct the TellService that per-test services are cloned from."""
+    return TellService(mock_state_manager, mock_gateway)
 
 
 @pytest.fixture
-def tell_service(mock_state_manager, mock_gateway):
-    """Create a TellService instance for testing."""
-    service = TellService(mock_state_manager, mock_gateway)
+def tell_service(tell_service_template):
+    """Clone the template service with fresh per-test state."""
+    service = copy.copy(tell_service_template)
+    service.recent_tells = {}
+    service.tell_history = {}
+    service.metrics = ServiceMetrics()
     return service
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_shared_mocks(mock_state_manager, mock_gateway):
+    """Reset the module-scoped mocks after each test."""
+    yield
+    mock_state_manager.reset_mock()
+    mock_state_manager.find_user_session.return_value = None
+    mock_state_manager.find_user_session.side_effect = None
+    mock_state_manager.has_current_presence.return_value = True
+    mock_gateway.send_packet.reset_mock()
+    mock_gateway.send_packet.return_value = True
+    mock_gateway.sent.clear()
+
+
+@pytest.fixture(scope="module")
 def sample_tell_packet():
     """Create a sample tell packet."""
-    return TellPacket(
-        ttl=200,
-        originator_mud="RemoteMUD",
-        originator_user="sender",
-        target_mud="TestMUD",
-        target_user="receiver",
-        message="Hello there!",
-    )
+    return TellPacket(**_PACKET_DEFAULTS, originator_user="sender", message="Hello there!")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_emoteto_packet():
     """Create a sample emoteto packet."""
-    return EmotetoPacket(
-        ttl=200,
-        originator_mud="RemoteMUD",
-        originator_user="sender",
-        target_mud="TestMUD",
-        target_user="receiver",
-        message="waves happily.",
-    )
+    return EmotetoPacket(**_PACKET_DEFAULTS, originator_user="sender", message="waves happily.")
+
+
+# Validated once at import; clone_tell() derives per-message packets from it.
+_TELL_TEMPLATE = TellPacket(**_PACKET_DEFAULTS, originator_user="sender", message="template")
+
+
+def clone_tell(originator_user, message):
+    """Copy the template tell and overwrite sender and message without revalidating."""
+    packet = copy.copy(_TELL_TEMPLATE)
+    packet.originator_user = packet.visname = originator_user
+    packet.message = message
+    return packet
+
+
+@pytest.fixture(scope="module")
+def history_packets():
+    """Create the tells that overflow the 20-message history."""
+    return tuple(clone_tell(f"sender{i}", f"Message {i}") for i in range(25))
+
+
+@pytest.fixture(scope="module")
+def concurrent_tell_packets():
+    """Create the tells sent concurrently to one user."""
+    return tuple(clone_tell(f"sender{i}", f"Concurrent message {i}") for i in range(10))
+
+
+@dataclass(slots=True)
+class FakePacket:
+    """Minimal non-TellPacket carrying the fields validate_packet reads."""
+
+    packet_type: PacketType
+    originator_user: str = ""
+    target_user: str = ""
+
+
+@dataclass(slots=True)
+class FakeSession:
+    """Minimal stand-in for the UserSession fields TellService reads."""
+
+    is_online: bool
+    username: str = "receiver"
 
 
 @pytest.fixture
 def online_user_session():
     """Create an online user session."""
-    session = Mock(spec=UserSession)
-    session.is_online = True
-    session.username = "receiver"
-    return session
+    return FakeSession(is_online=True)
 
 
 @pytest.fixture
 def offline_user_session():
     """Create an offline user session."""
-    session = Mock(spec=UserSession)
-    session.is_online = False
-    session.username = "receiver"
-    return session
+    return FakeSession(is_online=False)
+
+
+@pytest.fixture
+def state_online(mock_state_manager, online_user_session):
+    """Configure the state manager to find the target user online."""
+    mock_state_manager.find_user_session.return_value = online_user_session
+    return mock_state_manager
+
+
+@pytest.fixture
+def state_offline(mock_state_manager, offline_user_session):
+    """Configure the state manager to find the target user offline."""
+    mock_state_manager.find_user_session.return_value = offline_user_session
+    return mock_state_manager
+
+
+@pytest.fixture
+def state_missing(mock_state_manager):
+    """Configure the state manager to find no session for the target user."""
+    mock_state_manager.find_user_session.return_value = None
+    return mock_state_manager
 
 
+@pytest.fixture
+def session_state(request):
+    """Resolve one of the state_* fixtures named by an indirect parameter."""
+    return request.getfixturevalue(request.param)
+
+
+@module_loop
 class TestTellServiceInitialization:
     """Test TellService initialization."""
 
     async def test_initialization(self, tell_service):
         """Test service initialization."""
-        await tell_service.initialize()
+        # __init__ sets up all handler state; other tests never call initialize()
         assert tell_service.service_name == "tell"
         assert PacketType.TELL in tell_service.supported_packets
         assert PacketType.EMOTETO in tell_service.supported_packets
@@ -102,6 +193,9 @@ class TestTellServiceInitialization:
         assert tell_service.recent_tells == {}
         assert tell_service.tell_history == {}
 
+        await tell_service.initialize()
+        assert tell_service._initialized
+
     async def test_initialization_without_gateway(self, mock_state_manager):
         """Test service initialization without gateway."""
         service = TellService(mock_state_manager, None)
@@ -109,93 +203,75 @@ class TestTellServiceInitialization:
         assert service.gateway is None
 
 
+@module_loop
 class TestTellPacketHandling:
     """Test handling of tell packets."""
 
-    async def test_handle_tell_online_user(
-        self, tell_service, sample_tell_packet, mock_state_manager, online_user_session
-    ):
-        """Test handling tell to online user."""
-        mock_state_manager.find_user_session.return_value = online_user_session
-
-        result = await tell_service.handle_packet(sample_tell_packet)
-
-        assert result is None  # No error
-        assert tell_service.recent_tells["receiver"] == "RemoteMUD:sender"
-        assert len(tell_service.tell_history["receiver"]) == 1
-        assert tell_service.tell_history["receiver"][0]["message"] == "Hello there!"
-        assert tell_service.metrics.packets_handled == 1
-
-    async def test_handle_tell_offline_user(
-        self, tell_service, sample_tell_packet, mock_state_manager, offline_user_session
+    @pytest.mark.parametrize(
+        "session_state,expect_error",
+        [("state_online", False), ("state_offline", True)],
+        indirect=["session_state"],
+    )
+    async def test_handle_tell_session_state(
+        self, tell_service, sample_tell_packet, session_state, expect_error
     ):
-        """Test handling tell to offline user."""
-        mock_state_manager.find_user_session.return_value = offline_user_session
-
+        """Test handling tell to an online or offline user."""
         result = await tell_service.handle_packet(sample_tell_packet)
 
-        assert isinstance(result, ErrorPacket)
-        assert result.error_code == "unk-user"
-        assert "not online" in result.error_message
-        assert result.target_mud == "RemoteMUD"
-        assert result.target_user == "sender"
-
-    async def test_handle_tell_nonexistent_user(
-        self, tell_service, sample_tell_packet, mock_state_manager
-    ):
+        assert isinstance(result, ErrorPacket) == expect_error
+        if expect_error:
+            assert result.error_code == "unk-user"
+            assert "not online" in result.error_message
+            assert result.target_mud == "RemoteMUD"
+            assert result.target_user == "sender"
+        else:
+            assert result is None
+            assert tell_service.recent_tells["receiver"] == "RemoteMUD:sender"
+            assert len(tell_service.tell_history["receiver"]) == 1
+            assert tell_service.tell_history["receiver"][0]["message"] == "Hello there!"
+            assert tell_service.metrics.packets_handled == 1
+
+    @pytest.mark.usefixtures("state_missing")
+    async def test_handle_tell_nonexistent_user(self, tell_service, sample_tell_packet):
         """Test handling tell to nonexistent user."""
-        mock_state_manager.find_user_session.return_value = None
-
         result = await tell_service.handle_packet(sample_tell_packet)
 
         assert isinstance(result, ErrorPacket)
         assert result.error_code == "unk-user"
 
+    @pytest.mark.parametrize(
+        "n_packets,expected_len,expected_first_idx",
+        [
+            (1, 1, 0),
+            (20, 20, 0),  # Exactly at the history limit
+            (25, 20, 5),  # First 5 messages should have been removed
+        ],
+    )
+    @pytest.mark.usefixtures("state_online")
     async def test_tell_history_management(
-        self, tell_service, mock_state_manager, online_user_session
+        self, tell_service, history_packets, n_packets, expected_len, expected_first_idx
     ):
-        """Test tell history is properly managed."""
-        mock_state_manager.find_user_session.return_value = online_user_session
-
-        # Send 25 tells to test history limit
-        for i in range(25):
-            packet = TellPacket(
-                ttl=200,
-                originator_mud="RemoteMUD",
-                originator_user=f"sender{i}",
-                target_mud="TestMUD",
-                target_user="receiver",
-                message=f"Message {i}",
-            )
+        """Test tell history is properly managed and limited to 20 messages."""
+        for packet in history_packets[:n_packets]:
             await tell_service.handle_packet(packet)
 
-        # History should be limited to 20 messages
-        assert len(tell_service.tell_history["receiver"]) == 20
-        # First 5 messages should have been removed
-        assert tell_service.tell_history["receiver"][0]["message"] == "Message 5"
-        assert tell_service.tell_history["receiver"][-1]["message"] == "Message 24"
+        history = tell_service.tell_history["receiver"]
+        assert len(history) == expected_len
+        assert history[0]["message"] == f"Message {expected_first_idx}"
+        assert history[-1]["message"] == f"Message {n_packets - 1}"
 
-    async def test_tell_updates_recent_tells(
-        self, tell_service, mock_state_manager, online_user_session
-    ):
+    @pytest.mark.usefixtures("state_online")
+    async def test_tell_updates_recent_tells(self, tell_service):
         """Test that recent tells are properly updated."""
-        mock_state_manager.find_user_session.return_value = online_user_session
-
         # Send tells from different users
         packet1 = TellPacket(
-            ttl=200,
-            originator_mud="MUD1",
+            **{**_PACKET_DEFAULTS, "originator_mud": "MUD1"},
             originator_user="user1",
-            target_mud="TestMUD",
-            target_user="receiver",
             message="First message",
         )
         packet2 = TellPacket(
-            ttl=200,
-            originator_mud="MUD2",
+            **{**_PACKET_DEFAULTS, "originator_mud": "MUD2"},
             originator_user="user2",
-            target_mud="TestMUD",
-            target_user="receiver",
             message="Second message",
         )
 
@@ -206,125 +282,83 @@ class TestTellPacketHandling:
         assert tell_service.recent_tells["receiver"] == "MUD2:user2"
 
 
+@module_loop
 class TestEmotetoPacketHandling:
     """Test handling of emoteto packets."""
 
-    async def test_handle_emoteto_online_user(
-        self, tell_service, sample_emoteto_packet, mock_state_manager, online_user_session
-    ):
-        """Test handling emoteto to online user."""
-        mock_state_manager.find_user_session.return_value = online_user_session
-
-        result = await tell_service.handle_packet(sample_emoteto_packet)
-
-        assert result is None  # No error
-        assert tell_service.recent_tells["receiver"] == "RemoteMUD:sender"
-        assert tell_service.metrics.packets_handled == 1
-
-    async def test_handle_emoteto_offline_user(
-        self, tell_service, sample_emoteto_packet, mock_state_manager, offline_user_session
+    @pytest.mark.parametrize(
+        "session_state,expect_error",
+        [("state_online", False), ("state_offline", True)],
+        indirect=["session_state"],
+    )
+    async def test_handle_emoteto_session_state(
+        self, tell_service, sample_emoteto_packet, session_state, expect_error
     ):
-        """Test handling emoteto to offline user."""
-        mock_state_manager.find_user_session.return_value = offline_user_session
-
+        """Test handling emoteto to an online or offline user."""
         result = await tell_service.handle_packet(sample_emoteto_packet)
 
-        assert isinstance(result, ErrorPacket)
-        assert result.error_code == "unk-user"
-        assert "not online" in result.error_message
-
-    async def test_emoteto_updates_recent_tells(
-        self, tell_service, sample_emoteto_packet, mock_state_manager, online_user_session
-    ):
+        assert isinstance(result, ErrorPacket) == expect_error
+        if expect_error:
+            assert result.error_code == "unk-user"
+            assert "not online" in result.error_message
+        else:
+            assert result is None
+            assert tell_service.recent_tells["receiver"] == "RemoteMUD:sender"
+            assert tell_service.metrics.packets_handled == 1
+
+    @pytest.mark.usefixtures("state_online")
+    async def test_emoteto_updates_recent_tells(self, tell_service, sample_emoteto_packet):
         """Test that emoteto updates recent tells."""
-        mock_state_manager.find_user_session.return_value = online_user_session
-
         await tell_service.handle_packet(sample_emoteto_packet)
 
         assert tell_service.recent_tells["receiver"] == "RemoteMUD:sender"
 
 
 class TestPacketValidation:
-    """Test packet validation."""
+    """Test packet validation through the synchronous check_packet()."""
 
-    async def test_validate_valid_tell_packet(self, tell_service, sample_tell_packet):
+    def test_validate_valid_tell_packet(self, tell_service, sample_tell_packet):
         """Test validation of valid tell packet."""
-        assert await tell_service.validate_packet(sample_tell_packet) is True
+        assert tell_service.check_packet(sample_tell_packet) is True
 
-    async def test_validate_valid_emoteto_packet(self, tell_service, sample_emoteto_packet):
+    def test_validate_valid_emoteto_packet(self, tell_service, sample_emoteto_packet):
         """Test validation of valid emoteto packet."""
-        assert await tell_service.validate_packet(sample_emoteto_packet) is True
+        assert tell_service.check_packet(sample_emoteto_packet) is True
 
-    async def test_validate_unsupported_packet_type(self, tell_service):
+    def test_validate_unsupported_packet_type(self, tell_service):
         """Test validation rejects unsupported packet types."""
-        packet = Mock(spec=I3Packet)
-        packet.packet_type = PacketType.CHANLIST_REPLY
-
-        assert await tell_service.validate_packet(packet) is False
+        packet = FakePacket(PacketType.CHANLIST_REPLY)
+
+        assert tell_service.check_packet(packet) is False
+
+    # Every case exercises the same __post_init__ check
+    @pytest.mark.fast_only_one
+    @pytest.mark.parametrize(
+        "packet_class,field,value,match",
+        [
+            (TellPacket, "originator_user", "", "Tell requires originator user"),
+            (TellPacket, "target_user", "", "Tell requires target user"),
+            (TellPacket, "message", "", "Tell requires a message"),
+            (EmotetoPacket, "message", "", "Emoteto requires a message"),
+        ],
+    )
+    def test_validate_rejects_bad_field(self, packet_class, field, value, match):
+        """Test validation rejects packets with an empty required field."""
+        fields = {**_PACKET_DEFAULTS, "originator_user": "sender", "message": "Hello", field: value}
 
-    async def test_validate_tell_missing_originator(self, tell_service):
-        """Test validation rejects tell without originator user."""
-        # Packet validation happens in __post_init__, so we expect an exception
-        with pytest.raises(PacketValidationError, match="Tell requires originator user"):
-            packet = TellPacket(
-                ttl=200,
-                originator_mud="RemoteMUD",
-                originator_user="",  # Empty
-                target_mud="TestMUD",
-                target_user="receiver",
-                message="Hello",
-            )
-
-    async def test_validate_tell_missing_target(self, tell_service):
-        """Test validation rejects tell without target user."""
-        # Packet validation happens in __post_init__, so we expect an exception
-        with pytest.raises(PacketValidationError, match="Tell requires target user"):
-            packet = TellPacket(
-                ttl=200,
-                originator_mud="RemoteMUD",
-                originator_user="sender",
-                target_mud="TestMUD",
-                target_user="",  # Empty
-                message="Hello",
-            )
-
-    async def test_validate_tell_empty_message(self, tell_service):
-        """Test validation rejects tell with empty message."""
-        # Packet validation happens in __post_init__, so we expect an exception
-        with pytest.raises(PacketValidationError, match="Tell requires a message"):
-            packet = TellPacket(
-                ttl=200,
-                originator_mud="RemoteMUD",
-                originator_user="sender",
-                target_mud="TestMUD",
-                target_user="receiver",
-                message="",  # Empty
-            )
-
-    async def test_validate_emoteto_empty_message(self, tell_service):
-        """Test validation rejects emoteto with empty message."""
         # Packet validation happens in __post_init__, so we expect an exception
-        with pytest.raises(PacketValidationError, match="Emoteto requires a message"):
-            packet = EmotetoPacket(
-                ttl=200,
-                originator_mud="RemoteMUD",
-                originator_user="sender",
-                target_mud="TestMUD",
-                target_user="receiver",
-                message="",  # Empty
-            )
-
-    async def test_validate_wrong_packet_class(self, tell_service):
+        with pytest.raises(PacketValidationError, match=match):
+            packet_class(**fields)
+
+    def test_validate_wrong_packet_class(self, tell_service):
         """Test validation rejects wrong packet class."""
-        packet = Mock(spec=I3Packet)
-        packet.packet_type = PacketType.TELL
-        packet.originator_user = "sender"
-        packet.target_user = "receiver"
+        packet = FakePacket(PacketType.TELL, originator_user="sender", target_user="receiver")
 
         # Not actually a TellPacket instance
-        assert await tell_service.validate_packet(packet) is False
+        assert tell_service.check_packet(packet) is False
 
 
+@module_loop
 class TestSendingMessages:
     """Test sending tell and emoteto messages."""
 
@@ -338,9 +372,9 @@ class TestSendingMessages:
         )
 
         assert result is True
-        mock_gateway.send_packet.assert_called_once()
+        assert len(mock_gateway.sent) == 1
 
-        sent_packet = mock_gateway.send_packet.call_args[0][0]
+        sent_packet = mock_gateway.sent[0]
         assert isinstance(sent_packet, TellPacket)
         assert sent_packet.originator_user == "alice"
         assert sent_packet.target_user == "bob"
@@ -355,7 +389,7 @@ class TestSendingMessages:
         )
 
         assert result is True
-        sent_packet = mock_gateway.send_packet.call_args[0][0]
+        sent_packet = mock_gateway.sent[0]
         assert sent_packet.visname == "alice"  # Defaults to from_user
 
     async def test_send_tell_gateway_failure(self, tell_service, mock_gateway):
@@ -368,12 +402,16 @@ class TestSendingMessages:
 
         assert result is False
 
-    async def test_send_tell_no_gateway(self, mock_state_manager):
-        """Test tell sending without gateway."""
+    @pytest.mark.parametrize(
+        "method,message",
+        [("send_tell", "Hello Bob!"), ("send_emoteto", "waves.")],
+    )
+    async def test_send_no_gateway(self, mock_state_manager, method, message):
+        """Test tell and emoteto sending without gateway."""
         service = TellService(mock_state_manager, None)
 
-        result = await service.send_tell(
-            from_user="alice", to_user="bob", to_mud="RemoteMUD", message="Hello Bob!"
+        result = await getattr(service, method)(
+            from_user="alice", to_user="bob", to_mud="RemoteMUD", message=message
         )
 
         assert result is False
@@ -388,34 +426,22 @@ class TestSendingMessages:
         )
 
         assert result is True
-        mock_gateway.send_packet.assert_called_once()
+        assert len(mock_gateway.sent) == 1
 
-        sent_packet = mock_gateway.send_packet.call_args[0][0]
+        sent_packet = mock_gateway.sent[0]
         assert isinstance(sent_packet, EmotetoPacket)
         assert sent_packet.originator_user == "alice"
         assert sent_packet.target_user == "bob"
         assert sent_packet.message == "waves happily."
 
-    async def test_send_emoteto_no_gateway(self, mock_state_manager):
-        """Test emoteto sending without gateway."""
-        service = TellService(mock_state_manager, None)
-
-        result = await service.send_emoteto(
-            from_user="alice", to_user="bob", to_mud="RemoteMUD", message="waves."
-        )
-
-        assert result is False
-
 
+@module_loop
 class TestUtilityMethods:
     """Test utility methods."""
 
-    async def test_get_last_tell_sender(
-        self, tell_service, sample_tell_packet, mock_state_manager, online_user_session
-    ):
+    @pytest.mark.usefixtures("state_online")
+    async def test_get_last_tell_sender(self, tell_service, sample_tell_packet):
         """Test getting last tell sender."""
-        mock_state_manager.find_user_session.return_value = online_user_session
-
         # Initially no sender
         assert tell_service.get_last_tell_sender("receiver") is None
 
@@ -430,22 +456,12 @@ class TestUtilityMethods:
         history = tell_service.get_tell_history("unknown_user")
         assert history == []
 
-    async def test_get_tell_history_with_messages(
-        self, tell_service, sample_tell_packet, mock_state_manager, online_user_session
-    ):
+    @pytest.mark.usefixtures("state_online")
+    async def test_get_tell_history_with_messages(self, tell_service):
         """Test getting tell history with messages."""
-        mock_state_manager.find_user_session.return_value = online_user_session
-
         # Send some tells
         for i in range(3):
-            packet = TellPacket(
-                ttl=200,
-                originator_mud="RemoteMUD",
-                originator_user=f"sender{i}",
-                target_mud="TestMUD",
-                target_user="receiver",
-                message=f"Message {i}",
-            )
+            packet = clone_tell(f"sender{i}", f"Message {i}")
             await tell_service.handle_packet(packet)
 
         history = tell_service.get_tell_history("receiver")
@@ -455,55 +471,29 @@ class TestUtilityMethods:
         assert "timestamp" in history[0]
 
 
+@module_loop
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
     async def test_handle_invalid_packet_type(self, tell_service):
         """Test handling unsupported packet type."""
-        packet = Mock(spec=I3Packet)
-        packet.packet_type = PacketType.CHANNEL_M  # Not supported
+        packet = FakePacket(PacketType.CHANNEL_M)  # Not supported
 
         result = await tell_service.handle_packet(packet)
         assert result is None
 
-    async def test_concurrent_tells_to_same_user(
-        self, tell_service, mock_state_manager, online_user_session
-    ):
+    @pytest.mark.usefixtures("state_online")
+    async def test_concurrent_tells_to_same_user(self, tell_service, concurrent_tell_packets):
         """Test handling concurrent tells to same user."""
-        mock_state_manager.find_user_session.return_value = online_user_session
-
-        # Create multiple tell packets
-        packets = []
-        for i in range(10):
-            packet = TellPacket(
-                ttl=200,
-                originator_mud="RemoteMUD",
-                originator_user=f"sender{i}",
-                target_mud="TestMUD",
-                target_user="receiver",
-                message=f"Concurrent message {i}",
-            )
-            packets.append(packet)
-
-        # Handle them concurrently
-        tasks = [tell_service.handle_packet(p) for p in packets]
-        results = await asyncio.gather(*tasks)
+        results = await gather(*(tell_service.handle_packet(p) for p in concurrent_tell_packets))
 
         # All should succeed
         assert all(r is None for r in results)
         assert len(tell_service.tell_history["receiver"]) == 10
 
-    async def test_metrics_tracking(
-        self,
-        tell_service,
-        sample_tell_packet,
-        sample_emoteto_packet,
-        mock_state_manager,
-        online_user_session,
-    ):
+    @pytest.mark.usefixtures("state_online")
+    async def test_metrics_tracking(self, tell_service, sample_tell_packet, sample_emoteto_packet):
         """Test that metrics are properly tracked."""
-        mock_state_manager.find_user_session.return_value = online_user_session
-
         assert tell_service.metrics.packets_handled == 0
 
         await tell_service.handle_packet(sample_tell_packet)
@@ -512,13 +502,11 @@ class TestEdgeCases:
         await tell_service.handle_packet(sample_emoteto_packet)
         assert tell_service.metrics.packets_handled == 2
 
-    @patch("asyncio.get_event_loop")
-    async def test_timestamp_in_history(
-        self, mock_loop, tell_service, sample_tell_packet, mock_state_manager, online_user_session
-    ):
+    @pytest.mark.usefixtures("state_online")
+    async def test_timestamp_in_history(self, monkeypatch, tell_service, sample_tell_packet):
         """Test that timestamps are added to history."""
-        mock_state_manager.find_user_session.return_value = online_user_session
-        mock_loop.return_value.time.return_value = 12345.678
+        # Swap the module's clock only, leaving the event loop's time source intact
+        monkeypatch.setattr("src.services.tell.time", SimpleNamespace(monotonic=lambda: 12345.678))
 
         await tell_service.handle_packet(sample_tell_packet)
 
@@ -528,10 +516,7 @@ class TestEdgeCases:
     async def test_validate_packet_edge_cases(self, tell_service):
         """Test validation edge cases."""
         # Test with wrong packet class but supported type
-        packet = Mock()
-        packet.packet_type = PacketType.TELL
-        packet.originator_user = "test"
-        packet.target_user = "test"
+        packet = FakePacket(PacketType.TELL, originator_user="test", target_user="test")
 
         # Should fail because it's not a TellPacket instance
         assert await tell_service.validate_packet(packet) is False
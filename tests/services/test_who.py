@@ -1,26 +1,30 @@
 """Comprehensive unit tests for WhoService."""
 
 import asyncio
-from datetime import datetime, timedelta
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from src.models.connection import UserSession
 from src.models.packet import I3Packet, PacketType, WhoPacket
-from src.services.who import WhoService
+from src.services.who import OnlineIndex, WhoService
 from src.state.manager import StateManager
 
+# Every test here is async; they share one event loop across the module
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 @pytest.fixture
 def mock_state_manager():
     """Create a mock state manager."""
-    manager = Mock(spec=StateManager)
-    manager.sessions = {}
-    manager.get_sessions_for_mud = AsyncMock(
-        side_effect=lambda _mud_name: list(manager.sessions.values())
-    )
-    return manager
+    manager = Mock(spec=StateManager)
+    manager.sessions = {}
+    return manager
 
 
 @pytest.fixture
@@ -42,6 +46,28 @@ def who_service(mock_state_manager, mock_gateway):
     return service
 
 
+@dataclass(slots=True)
+class FakeSession:
+    """Minimal stand-in for the UserSession fields WhoService reads."""
+
+    session_id: str = "session_1"
+    is_online: bool = True
+    user_name: str = "TestUser"
+    title: str = "The Tester"
+    level: int = 30
+    race: str = ""
+    guild: str = ""
+    mud_name: str = "TestMUD"
+    last_activity_monotonic: float = field(default_factory=time.monotonic)
+    presence_updated_at: datetime = field(default_factory=datetime.now)
+
+
+def index_sessions(who_service, sessions):
+    """Add sessions to the service's online index."""
+    for session in sessions:
+        who_service._online_index.add(session)
+
+
 @pytest.fixture
 def sample_who_request():
     """Create a sample who request packet."""
@@ -73,15 +99,7 @@ def sample_who_reply():
 @pytest.fixture
 def online_user_session():
     """Create an online user session."""
-    session = Mock(spec=UserSession)
-    session.is_online = True
-    session.user_name = "TestUser"
-    session.title = "The Brave Adventurer"
-    session.level = 45
-    session.race = "human"
-    session.guild = "warriors"
-    session.last_activity = datetime.now()
-    return session
+    return FakeSession(title="The Brave Adventurer", level=45, race="human", guild="warriors")
 
 
 @pytest.fixture
@@ -108,15 +126,15 @@ def multiple_user_sessions():
     ]
 
     for i, user_data in enumerate(users_data):
-        session = Mock(spec=UserSession)
-        session.is_online = True
-        session.user_name = user_data["name"]
-        session.title = user_data["title"]
-        session.level = user_data["level"]
-        session.race = user_data["race"]
-        session.guild = user_data["guild"]
-        session.last_activity = datetime.now()
-        sessions[f"session_{i}"] = session
+        session = FakeSession(
+            session_id=f"session_{i}",
+            user_name=user_data["name"],
+            title=user_data["title"],
+            level=user_data["level"],
+            race=user_data["race"],
+            guild=user_data["guild"],
+        )
+        sessions[session.session_id] = session
 
     return sessions
 
@@ -162,7 +180,7 @@ class TestWhoRequestHandling:
         self, who_service, sample_who_request, online_user_session
     ):
         """Test handling who request with single online user."""
-        who_service.state_manager.sessions = {"session_1": online_user_session}
+        index_sessions(who_service, [online_user_session])
 
         result = await who_service.handle_packet(sample_who_request)
 
@@ -178,7 +196,7 @@ class TestWhoRequestHandling:
         self, who_service, sample_who_request, multiple_user_sessions
     ):
         """Test handling who request with multiple online users."""
-        who_service.state_manager.sessions = multiple_user_sessions
+        index_sessions(who_service, multiple_user_sessions.values())
 
         result = await who_service.handle_packet(sample_who_request)
 
@@ -190,8 +208,6 @@ class TestWhoRequestHandling:
 
     async def test_handle_who_request_no_users(self, who_service, sample_who_request):
         """Test handling who request with no online users."""
-        who_service.state_manager.sessions = {}
-
         result = await who_service.handle_packet(sample_who_request)
 
         assert isinstance(result, WhoPacket)
@@ -199,11 +215,9 @@ class TestWhoRequestHandling:
 
     async def test_handle_who_request_offline_users(self, who_service, sample_who_request):
         """Test handling who request with offline users."""
-        offline_session = Mock(spec=UserSession)
-        offline_session.is_online = False
-        offline_session.user_name = "OfflineUser"
+        offline_session = FakeSession(is_online=False, user_name="OfflineUser")
 
-        who_service.state_manager.sessions = {"session_1": offline_session}
+        index_sessions(who_service, [offline_session])
 
         result = await who_service.handle_packet(sample_who_request)
 
@@ -212,7 +226,7 @@ class TestWhoRequestHandling:
 
     async def test_who_request_with_level_filters(self, who_service, multiple_user_sessions):
         """Test who request with level filters."""
-        who_service.state_manager.sessions = multiple_user_sessions
+        index_sessions(who_service, multiple_user_sessions.values())
 
         # Request with minimum level 30
         request = WhoPacket(
@@ -232,7 +246,7 @@ class TestWhoRequestHandling:
 
     async def test_who_request_with_level_range_filters(self, who_service, multiple_user_sessions):
         """Test who request with level range filters."""
-        who_service.state_manager.sessions = multiple_user_sessions
+        index_sessions(who_service, multiple_user_sessions.values())
 
         # Request with level range 20-40
         request = WhoPacket(
@@ -252,7 +266,7 @@ class TestWhoRequestHandling:
 
     async def test_who_request_with_race_filter(self, who_service, multiple_user_sessions):
         """Test who request with race filter."""
-        who_service.state_manager.sessions = multiple_user_sessions
+        index_sessions(who_service, multiple_user_sessions.values())
 
         request = WhoPacket(
             packet_type=PacketType.WHO_REQ,
@@ -272,7 +286,7 @@ class TestWhoRequestHandling:
 
     async def test_who_request_with_guild_filter(self, who_service, multiple_user_sessions):
         """Test who request with guild filter."""
-        who_service.state_manager.sessions = multiple_user_sessions
+        index_sessions(who_service, multiple_user_sessions.values())
 
         request = WhoPacket(
             packet_type=PacketType.WHO_REQ,
@@ -315,22 +329,57 @@ class TestWhoCaching:
 
     async def test_cache_who_results(self, who_service, sample_who_request, online_user_session):
         """Test that who results are cached."""
-        who_service.state_manager.sessions = {"session_1": online_user_session}
+        index_sessions(who_service, [online_user_session])
 
-        # First request - should cache results
+        # First request - should cache results under the packet's filter key
         result1 = await who_service.handle_packet(sample_who_request)
-        assert len(who_service.who_cache) == 1
+        assert list(who_service.who_cache) == [sample_who_request.filter_key]
 
         # Second request - should use cache
-        with patch.object(who_service, "_get_online_users") as mock_get_users:
+        with patch.object(who_service, "_build_who_data") as mock_build:
             result2 = await who_service.handle_packet(sample_who_request)
-            mock_get_users.assert_not_called()  # Should not be called due to cache
+            mock_build.assert_not_called()  # Should not be called due to cache
 
         assert result1.who_data == result2.who_data
+        assert result1.who_data is not result2.who_data  # Each reply gets its own dicts
+        assert json.loads(json.dumps(result2.who_data)) == result1.who_data
+
+    async def test_cache_keyed_by_filters(
+        self, who_service, sample_who_request, multiple_user_sessions
+    ):
+        """Test that filtered requests do not reuse unfiltered cached results."""
+        index_sessions(who_service, multiple_user_sessions.values())
+        await who_service.handle_packet(sample_who_request)
+
+        filtered_request = WhoPacket(
+            packet_type=PacketType.WHO_REQ,
+            ttl=200,
+            originator_mud="RemoteMUD",
+            originator_user="requester",
+            target_mud="TestMUD",
+            target_user="",
+            filter_criteria={"level_min": 30},
+        )
+        result = await who_service.handle_packet(filtered_request)
+
+        assert len(result.who_data) == 2
+        assert len(who_service.who_cache) == 2
+
+    async def test_cached_reply_reuses_wire_rows(
+        self, who_service, sample_who_request, online_user_session
+    ):
+        """Test that cache hits share the pre-built who-reply rows."""
+        index_sessions(who_service, [online_user_session])
+
+        result1 = await who_service.handle_packet(sample_who_request)
+        result2 = await who_service.handle_packet(sample_who_request)
+
+        assert result2.who_rows is result1.who_rows
+        assert result2.to_lpc_array()[6] == WhoPacket.encode_who_data(result2.who_data)
 
     async def test_cache_expiry(self, who_service, sample_who_request, online_user_session):
         """Test that cache expires after TTL."""
-        who_service.state_manager.sessions = {"session_1": online_user_session}
+        index_sessions(who_service, [online_user_session])
         who_service.cache_ttl = 0.1  # Very short cache
 
         # First request
@@ -340,14 +389,32 @@ class TestWhoCaching:
         await asyncio.sleep(0.2)
 
         # Second request should not use cache
-        with patch.object(who_service, "_get_online_users") as mock_get_users:
-            mock_get_users.return_value = []
+        with patch.object(who_service, "_build_who_data") as mock_build:
+            mock_build.return_value = ([], [])
             await who_service.handle_packet(sample_who_request)
-            mock_get_users.assert_called_once()
+            mock_build.assert_called_once()
+
+    async def test_cache_bounded_by_maxsize(self, who_service, sample_who_request):
+        """Test that the oldest entry is evicted once the cache is full."""
+        who_service.cache_maxsize = 2
+
+        for level in (10, 20, 30):
+            request = WhoPacket(
+                packet_type=PacketType.WHO_REQ,
+                ttl=200,
+                originator_mud="RemoteMUD",
+                originator_user="requester",
+                target_mud="TestMUD",
+                target_user="",
+                filter_criteria={"level_min": level},
+            )
+            await who_service.handle_packet(request)
+
+        assert list(who_service.who_cache) == [(("level_min", 20),), (("level_min", 30),)]
 
     async def test_clear_cache(self, who_service, sample_who_request, online_user_session):
         """Test clearing the who cache."""
-        who_service.state_manager.sessions = {"session_1": online_user_session}
+        index_sessions(who_service, [online_user_session])
 
         # Add something to cache
         await who_service.handle_packet(sample_who_request)
@@ -424,22 +491,46 @@ class TestSendingWhoRequests:
         result = await who_service.send_who_request("RemoteMUD")
         assert result is False
 
+    async def test_send_who_request_all_bounded_concurrency(self, who_service, mock_gateway):
+        """Test fan-out sends run concurrently up to the semaphore limit."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_send(packet):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return packet.target_mud != "Mud13"
+
+        mock_gateway.send_packet.side_effect = slow_send
+        muds = [f"Mud{i}" for i in range(100)]
+
+        results = await who_service.send_who_request_all(muds, {"level_min": 10})
+
+        assert peak == who_service.max_concurrent_requests
+        assert results == [mud != "Mud13" for mud in muds]
+        sent = [call.args[0] for call in mock_gateway.send_packet.call_args_list]
+        assert sorted(packet.target_mud for packet in sent) == sorted(muds)
+
+    async def test_send_who_request_all_reports_errors(self, who_service, mock_gateway):
+        """Test a failing send does not abort the rest of the fan-out."""
+        mock_gateway.send_packet.side_effect = [True, ConnectionError("lost"), True]
+
+        results = await who_service.send_who_request_all(["MudA", "MudB", "MudC"])
+
+        assert results == [True, False, True]
+
 
 class TestUtilityMethods:
     """Test utility methods."""
 
     async def test_get_online_users_with_optional_fields(self, who_service):
         """Test getting online users with optional fields."""
-        session = Mock(spec=UserSession)
-        session.is_online = True
-        session.user_name = "TestUser"
-        session.title = "The Tester"
-        session.level = 30
-        session.race = "elf"
-        session.guild = "mages"
-        session.last_activity = datetime.now()
+        session = FakeSession(race="elf", guild="mages")
 
-        who_service.state_manager.sessions = {"session_1": session}
+        index_sessions(who_service, [session])
 
         users = await who_service._get_online_users({})
 
@@ -453,15 +544,10 @@ class TestUtilityMethods:
 
     async def test_get_online_users_missing_optional_fields(self, who_service):
         """Test getting online users without optional fields."""
-        session = Mock(spec=UserSession)
-        session.is_online = True
-        session.user_name = "TestUser"
-        session.title = "The Tester"
-        session.level = 30
-        session.last_activity = datetime.now()
-        # Missing race, guild attributes
+        # Race and guild not supplied by the MUD
+        session = FakeSession()
 
-        who_service.state_manager.sessions = {"session_1": session}
+        index_sessions(who_service, [session])
 
         users = await who_service._get_online_users({})
 
@@ -470,6 +556,50 @@ class TestUtilityMethods:
         assert "race" not in user
         assert "guild" not in user
 
+    async def test_get_online_users_unhashable_filter_value(
+        self, who_service, multiple_user_sessions
+    ):
+        """Test filters with unhashable values bypass the predicate cache."""
+        index_sessions(who_service, multiple_user_sessions.values())
+
+        users = await who_service._get_online_users({"race": ["elf"], "level_min": 10})
+
+        assert users == []
+
+    async def test_online_index_orders_by_casefolded_name(self):
+        """Test the online index keeps casefold order across renames."""
+        index = OnlineIndex()
+        sessions = [
+            UserSession(session_id=str(i), mud_name="TestMUD", user_name=name)
+            for i, name in enumerate(["zed", "Straße", "STRASSF", "amy"])
+        ]
+        for session in sessions:
+            index.add(session)
+        assert [s.user_name for s in index] == ["amy", "Straße", "STRASSF", "zed"]
+
+        sessions[0].user_name = "Bob"
+        index.add(sessions[0])
+        index.discard(sessions[3])
+        assert [s.user_name for s in index] == ["Bob", "Straße", "STRASSF"]
+        assert len(index) == 3
+
+    async def test_online_index_follows_session_events(self, mock_gateway):
+        """Test the online index tracks local sessions through the state manager."""
+        state_manager = StateManager()
+        existing = await state_manager.create_session("TestMUD", "zed")
+        service = WhoService(state_manager, mock_gateway)
+
+        amy = await state_manager.create_session("testmud", "Amy")
+        await state_manager.create_session("OtherMUD", "Bob")
+        assert [s.user_name for s in service._online_index] == ["Amy", "zed"]
+
+        await state_manager.remove_session(existing.session_id)
+        assert list(service._online_index) == [amy]
+
+        await service.shutdown()
+        await state_manager.create_session("TestMUD", "Cat")
+        assert list(service._online_index) == [amy]
+
     async def test_create_who_reply_structure(self, who_service, sample_who_request):
         """Test who reply packet structure."""
         users = [{"name": "TestUser", "idle": 120, "level": 50, "extra": ""}]
@@ -489,7 +619,7 @@ class TestConcurrentOperations:
 
     async def test_concurrent_who_requests(self, who_service, online_user_session):
         """Test handling concurrent who requests."""
-        who_service.state_manager.sessions = {"session_1": online_user_session}
+        index_sessions(who_service, [online_user_session])
 
         # Create multiple who request packets
         requests = []
@@ -514,9 +644,63 @@ class TestConcurrentOperations:
         assert all(isinstance(r, WhoPacket) for r in results)
         assert all(len(r.who_data) == 1 for r in results)
 
+    async def test_concurrent_cache_misses_build_once(
+        self, who_service, sample_who_request, online_user_session
+    ):
+        """Test that concurrent misses on one key build once and cache the result.
+
+        A miss never yields before storing its result, so the first request
+        fills the cache and the other nine are hits.
+        """
+        index_sessions(who_service, [online_user_session])
+
+        with patch.object(
+            who_service, "_build_who_data", wraps=who_service._build_who_data
+        ) as mock_build:
+            results = await asyncio.gather(
+                *(who_service.handle_packet(sample_who_request) for _ in range(10))
+            )
+
+        mock_build.assert_called_once()
+        assert list(who_service.who_cache) == [sample_who_request.filter_key]
+        assert all(len(r.who_data) == 1 for r in results)
+
+    async def test_concurrent_misses_build_once_per_cached_key(
+        self, who_service, online_user_session
+    ):
+        """Test that concurrent misses build once per key the cache can hold."""
+        index_sessions(who_service, [online_user_session])
+        requests = [
+            WhoPacket(
+                packet_type=PacketType.WHO_REQ,
+                ttl=200,
+                originator_mud="RemoteMUD",
+                originator_user="requester",
+                target_mud="TestMUD",
+                target_user="",
+                filter_criteria={"level_min": level},
+            )
+            for level in (10, 20, 10, 20, 10, 20)
+        ]
+
+        with patch.object(
+            who_service, "_build_who_data", wraps=who_service._build_who_data
+        ) as mock_build:
+            await asyncio.gather(*(who_service.handle_packet(r) for r in requests))
+        assert mock_build.call_count == 2
+
+        # With room for one key, alternating keys evict each other every time
+        who_service.clear_cache()
+        who_service.cache_maxsize = 1
+        with patch.object(
+            who_service, "_build_who_data", wraps=who_service._build_who_data
+        ) as mock_build:
+            await asyncio.gather(*(who_service.handle_packet(r) for r in requests))
+        assert mock_build.call_count == len(requests)
+
     async def test_cache_thread_safety(self, who_service, sample_who_request, online_user_session):
         """Test cache operations are thread-safe."""
-        who_service.state_manager.sessions = {"session_1": online_user_session}
+        index_sessions(who_service, [online_user_session])
 
         async def make_request():
             return await who_service.handle_packet(sample_who_request)
@@ -540,31 +724,41 @@ class TestEdgeCases:
         result = await who_service.handle_packet(packet)
         assert result is None
 
-    async def test_idle_time_calculation(self, who_service):
+    async def test_idle_time_calculation(self, monkeypatch, who_service):
         """Test idle time calculation accuracy."""
-        past_time = datetime.now()
+        session = FakeSession(last_activity_monotonic=1000.0)
 
-        session = Mock(spec=UserSession)
-        session.is_online = True
-        session.user_name = "TestUser"
-        session.title = "The Tester"
-        session.level = 30
-        session.last_activity = past_time
+        index_sessions(who_service, [session])
 
-        who_service.state_manager.sessions = {"session_1": session}
+        # Monotonic clock reads 5 minutes after the last activity
+        monkeypatch.setattr("src.services.who.time", SimpleNamespace(monotonic=lambda: 1300.0))
+
+        users = await who_service._get_online_users({})
 
-        with patch("src.services.who.datetime") as mock_datetime:
-            # Mock current time to be 5 minutes later
-            current_time = past_time + timedelta(minutes=5)
-            mock_datetime.now.return_value = current_time
+        assert users[0]["idle"] == 300  # 5 minutes in seconds
 
-            users = await who_service._get_online_users({})
+    async def test_idle_time_from_assigned_last_activity(self, who_service):
+        """Test idle time follows last_activity however it was set."""
+        constructed = UserSession(
+            session_id="1",
+            mud_name="TestMUD",
+            user_name="amy",
+            last_activity=datetime.now() - timedelta(minutes=10),
+        )
+        assigned = UserSession(session_id="2", mud_name="TestMUD", user_name="bob")
+        assigned.last_activity = datetime.now() - timedelta(minutes=5)
+
+        index_sessions(who_service, [constructed, assigned])
+
+        users = await who_service._get_online_users({})
+        idle = {user["name"]: user["idle"] for user in users}
 
-            assert users[0]["idle"] == 300  # 5 minutes in seconds
+        assert 599 <= idle["amy"] <= 601
+        assert 299 <= idle["bob"] <= 301
 
     async def test_empty_filter_criteria(self, who_service, online_user_session):
         """Test handling empty filter criteria."""
-        who_service.state_manager.sessions = {"session_1": online_user_session}
+        index_sessions(who_service, [online_user_session])
 
         users = await who_service._get_online_users(None)
         assert len(users) == 1
@@ -574,7 +768,7 @@ class TestEdgeCases:
 
     async def test_user_sorting(self, who_service, multiple_user_sessions):
         """Test that users are sorted correctly by name."""
-        who_service.state_manager.sessions = multiple_user_sessions
+        index_sessions(who_service, reversed(list(multiple_user_sessions.values())))
 
         users = await who_service._get_online_users({})
 
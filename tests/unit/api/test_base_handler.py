@@ -0,0 +1,200 @@
+"""Tests for the API handler base class."""
+
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from src.api.handlers import admin, channels, communication, information
+from src.api.handlers.base import BaseHandler
+from src.api.session import Session
+
+
+class SampleHandler(BaseHandler):
+    """Minimal concrete handler with two required params."""
+
+    __slots__ = ()
+
+    def get_required_params(self) -> list[str]:
+        return ["target_mud", "message"]
+
+    def validate_params(self, params: dict[str, Any]) -> bool:
+        return self.validate_base_params(params)
+
+    async def handle(self, session: Session, params: dict[str, Any]) -> Any:
+        self.authorize(session, "tell", params, "No permission to send tells")
+        return {"status": "sent"}
+
+
+def make_session(*permissions):
+    """Create a session holding the given permissions."""
+    now = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    return Session(
+        session_id="session-1",
+        mud_name="TestMUD",
+        api_key="test-key",
+        connected_at=now,
+        last_activity=now,
+        permissions=set(permissions),
+    )
+
+
+@pytest.fixture
+def handler():
+    """Create a sample handler."""
+    return SampleHandler()
+
+
+VALID_PARAMS = {"target_mud": "OtherMUD", "message": "hello"}
+
+
+class TestAuthorize:
+    """Test BaseHandler.authorize."""
+
+    def test_allowed(self, handler):
+        """Test that a permitted request with valid params passes."""
+        assert handler.authorize(make_session("tell"), "tell", VALID_PARAMS, "denied") is None
+
+    def test_wildcard_permission_allowed(self, handler):
+        """Test that the wildcard permission grants access."""
+        assert handler.authorize(make_session("*"), "tell", VALID_PARAMS, "denied") is None
+
+    def test_denied_uses_custom_message(self, handler):
+        """Test that a missing permission raises PermissionError with the given message."""
+        with pytest.raises(PermissionError, match=r"^No permission to send tells$"):
+            handler.authorize(
+                make_session("who"), "tell", VALID_PARAMS, "No permission to send tells"
+            )
+
+    def test_permission_checked_before_params(self, handler):
+        """Test that permission failures win over invalid params."""
+        with pytest.raises(PermissionError):
+            handler.authorize(make_session(), "tell", {}, "denied")
+
+    def test_invalid_params(self, handler):
+        """Test that invalid params raise ValueError."""
+        with pytest.raises(ValueError, match=r"^Invalid parameters$"):
+            handler.authorize(make_session("tell"), "tell", {"target_mud": "OtherMUD"}, "denied")
+
+    def test_uses_check_permission_override(self):
+        """Test that a subclass overriding check_permission controls authorize."""
+
+        class ReadOnlyHandler(SampleHandler):
+            __slots__ = ()
+
+            def check_permission(self, session: Session, permission: str) -> bool:
+                return permission == "who"
+
+        handler = ReadOnlyHandler()
+
+        with pytest.raises(PermissionError, match=r"^denied$"):
+            handler.authorize(make_session("*"), "tell", VALID_PARAMS, "denied")
+        assert handler.authorize(make_session(), "who", VALID_PARAMS, "denied") is None
+
+    async def test_handle_uses_authorize(self, handler):
+        """Test that a handler built on authorize rejects unauthorized sessions."""
+        assert await handler.handle(make_session("tell"), VALID_PARAMS) == {"status": "sent"}
+
+        with pytest.raises(PermissionError, match="No permission to send tells"):
+            await handler.handle(make_session(), VALID_PARAMS)
+
+
+class TestValidateBaseParams:
+    """Test BaseHandler.validate_base_params."""
+
+    def test_all_required_present(self, handler):
+        """Test that params holding every required key pass."""
+        assert handler.validate_base_params(VALID_PARAMS) is True
+
+    def test_extra_params_allowed(self, handler):
+        """Test that keys beyond the required ones are accepted."""
+        assert handler.validate_base_params({**VALID_PARAMS, "target_user": "bob"}) is True
+
+    def test_no_required_params(self):
+        """Test that a handler without required params accepts anything."""
+
+        class OptionalOnlyHandler(SampleHandler):
+            __slots__ = ()
+
+            def get_required_params(self) -> list[str]:
+                return []
+
+        handler = OptionalOnlyHandler()
+
+        assert handler.validate_base_params({}) is True
+        assert handler.validate_base_params(None) is True
+
+    @pytest.mark.parametrize(
+        ("params", "missing"),
+        [
+            ({"message": "hello"}, "target_mud"),
+            ({"target_mud": "OtherMUD"}, "message"),
+            ({}, "target_mud"),
+            (None, "target_mud"),
+        ],
+    )
+    def test_missing_required_param(self, handler, params, missing):
+        """Test that a missing key fails and the warning names it."""
+        with patch("src.api.handlers.base.logger") as mock_logger:
+            assert handler.validate_base_params(params) is False
+
+        mock_logger.warning.assert_called_once_with(f"Missing required parameter: {missing}")
+
+    def test_valid_params_do_not_log(self, handler):
+        """Test that the fast path logs nothing."""
+        with patch("src.api.handlers.base.logger") as mock_logger:
+            handler.validate_base_params(VALID_PARAMS)
+
+        mock_logger.warning.assert_not_called()
+
+
+HANDLER_CLASSES = [
+    cls
+    for module in (admin, channels, communication, information)
+    for cls in vars(module).values()
+    if isinstance(cls, type) and issubclass(cls, BaseHandler) and cls is not BaseHandler
+]
+
+
+class TestSlots:
+    """Test handler construction with the slotted base class."""
+
+    @pytest.mark.parametrize("handler_class", HANDLER_CLASSES, ids=lambda cls: cls.__name__)
+    def test_handlers_construct(self, handler_class):
+        """Test that every API handler constructs and sets its base attributes."""
+        gateway = object()
+
+        handler = handler_class(gateway)
+
+        assert handler.gateway is gateway
+        assert handler._required_params == tuple(handler.get_required_params())
+        assert handler._required_keys == frozenset(handler.get_required_params())
+        assert not hasattr(handler, "__dict__")
+
+    def test_gateway_can_be_replaced(self, handler):
+        """Test that slotted attributes stay assignable."""
+        gateway = object()
+
+        handler.gateway = gateway
+
+        assert handler.gateway is gateway
+
+    def test_undeclared_attribute_rejected(self, handler):
+        """Test that a subclass declaring empty __slots__ has no instance dict."""
+        with pytest.raises(AttributeError):
+            handler.cache = {}
+
+    def test_subclass_without_slots_sets_attributes(self):
+        """Test that subclasses not declaring __slots__ can still add attributes."""
+
+        class StatefulHandler(SampleHandler):
+            def __init__(self, gateway=None):
+                super().__init__(gateway)
+                self.sent = []
+
+        handler = StatefulHandler("gateway")
+
+        assert handler.gateway == "gateway"
+        assert handler.sent == []
+        assert handler.validate_params(VALID_PARAMS) is True
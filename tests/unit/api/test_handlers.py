@@ -1,6 +1,7 @@
 """Tests for API handlers."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass, field
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -10,19 +11,21 @@ import pytest
 # from src.api.handlers.information import InformationHandler
 # from src.api.handlers.channels import ChannelHandler
 # from src.api.handlers.admin import AdminHandler
-# Using actual available imports
-from src.api.session import Session
+from src.api.subscriptions import subscription_manager
+
+_VALID_LOG_LEVELS = frozenset(("DEBUG", "INFO", "WARNING", "ERROR"))
 
 
 # Placeholder classes for testing framework
 class BaseHandler:
+    name = "base"
+
     def __init__(self, gateway):
         self.gateway = gateway
-        self.name = "base"
 
     def validate_permission(self, session, permission):
         if not session.has_permission(permission):
-            raise Exception("Permission denied")
+            raise PermissionError("Permission denied")
 
     def validate_params(self, params, required):
         if not params:
@@ -33,9 +36,7 @@ class BaseHandler:
 
 
 class CommunicationHandler(BaseHandler):
-    def __init__(self, gateway):
-        super().__init__(gateway)
-        self.name = "communication"
+    name = "communication"
 
     async def tell(self, session, params):
         self.validate_permission(session, "tell")
@@ -53,9 +54,7 @@ class CommunicationHandler(BaseHandler):
 
 
 class InformationHandler(BaseHandler):
-    def __init__(self, gateway):
-        super().__init__(gateway)
-        self.name = "information"
+    name = "information"
 
     async def who_request(self, session, params):
         self.validate_permission(session, "who")
@@ -80,9 +79,7 @@ class InformationHandler(BaseHandler):
 
 
 class ChannelHandler(BaseHandler):
-    def __init__(self, gateway):
-        super().__init__(gateway)
-        self.name = "channel"
+    name = "channel"
 
     async def channel_message(self, session, params):
         self.validate_permission(session, "channel")
@@ -102,8 +99,6 @@ class ChannelHandler(BaseHandler):
         self.validate_permission(session, "channel")
         self.validate_params(params, ["channel"])
         # Mock implementation with subscription manager call
-        from src.api.subscriptions import subscription_manager
-
         subscription_manager.add_subscription(session.session_id, "channel", params["channel"])
         return {"status": "subscribed", "channel": params["channel"]}
 
@@ -111,8 +106,6 @@ class ChannelHandler(BaseHandler):
         self.validate_permission(session, "channel")
         self.validate_params(params, ["channel"])
         # Mock implementation with subscription manager call
-        from src.api.subscriptions import subscription_manager
-
         subscription_manager.remove_subscription(session.session_id, "channel", params["channel"])
         return {"status": "unsubscribed", "channel": params["channel"]}
 
@@ -125,9 +118,7 @@ class ChannelHandler(BaseHandler):
 
 
 class AdminHandler(BaseHandler):
-    def __init__(self, gateway):
-        super().__init__(gateway)
-        self.name = "admin"
+    name = "admin"
 
     async def gateway_status(self, session, params):
         self.validate_permission(session, "admin")
@@ -141,8 +132,7 @@ class AdminHandler(BaseHandler):
     async def set_log_level(self, session, params):
         self.validate_permission(session, "admin")
         self.validate_params(params, ["level"])
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
-        if params["level"] not in valid_levels:
+        if params["level"] not in _VALID_LOG_LEVELS:
             raise ValueError(f"Invalid log level: {params['level']}")
         return {"status": "log_level_updated", "level": params["level"]}
 
@@ -166,33 +156,57 @@ class AdminHandler(BaseHandler):
         return {"status": "shutdown_initiated"}
 
 
+@dataclass(slots=True)
+class FakeSession:
+    """Minimal stand-in for the Session fields the handlers read."""
+
+    session_id: str = "test-session-1"
+    mud_name: str = "TestMUD"
+    permissions: set[str] = field(
+        default_factory=lambda: {"tell", "channel", "who", "finger", "locate", "admin"}
+    )
+
+    def has_permission(self, permission: str) -> bool:
+        """Mirror Session.has_permission's exact-then-wildcard probe."""
+        permissions = self.permissions
+        return permission in permissions or "*" in permissions
+
+
 @pytest.fixture
 def mock_session():
-    """Create mock session for testing."""
-    session_data = {
-        "session_id": "test-session-1",
-        "mud_name": "TestMUD",
-        "permissions": {"tell", "channel", "who", "finger", "locate", "admin"},
-    }
-    session_data["api_key"] = "test-credential"
-
-    session = MagicMock(spec=Session)
-    session.session_id = session_data["session_id"]
-    session.mud_name = session_data["mud_name"]
-    session.permissions = session_data["permissions"]
-    session.has_permission = MagicMock(
-        side_effect=lambda perm: perm in session_data["permissions"] or perm == "*"
-    )
-    return session
+    """Create a lightweight session for testing."""
+    return FakeSession()
+
+
+@dataclass(slots=True)
+class StubGateway:
+    """Hand-rolled gateway recording what the placeholder handlers send."""
+
+    sent: list = field(default_factory=list)
+    mudlist: dict = field(default_factory=dict)
+    reconnects: int = 0
+    shutdowns: int = 0
+
+    async def send_packet(self, packet):
+        self.sent.append(packet)
+
+    def is_connected(self) -> bool:
+        return True
+
+    def get_mudlist(self) -> dict:
+        return self.mudlist
+
+    async def reconnect(self):
+        self.reconnects += 1
+
+    async def shutdown(self):
+        self.shutdowns += 1
 
 
 @pytest.fixture
 def mock_gateway():
-    """Create mock gateway for testing."""
-    gateway = MagicMock()
-    gateway.send_packet = AsyncMock()
-    gateway.is_connected = MagicMock(return_value=True)
-    return gateway
+    """Create a stub gateway for testing."""
+    return StubGateway()
 
 
 class TestBaseHandler:
@@ -218,7 +232,7 @@ class TestBaseHandler:
         """Test permission validation with invalid permission."""
         handler = BaseHandler(mock_gateway)
 
-        with pytest.raises(Exception):  # Should raise PermissionError
+        with pytest.raises(PermissionError):
             handler.validate_permission(mock_session, "admin_only")
 
     def test_validate_params_valid(self, mock_gateway):
@@ -269,7 +283,7 @@ class TestCommunicationHandler:
 
         assert result["status"] == "sent"
         assert "message_id" in result
-        handler.gateway.send_packet.assert_called_once()
+        assert len(handler.gateway.sent) == 1
 
     @pytest.mark.asyncio
     async def test_tell_missing_params(self, handler, mock_session):
@@ -288,13 +302,10 @@ class TestCommunicationHandler:
         """Test tell without permission."""
         # Remove the tell permission from the session
         mock_session.permissions = {"channel", "who", "finger", "admin"}  # No "tell"
-        mock_session.has_permission = MagicMock(
-            side_effect=lambda perm: perm in mock_session.permissions or perm == "*"
-        )
 
         params = {"target_mud": "OtherMUD", "target_user": "alice", "message": "Hello there!"}
 
-        with pytest.raises(Exception):  # Should raise PermissionError
+        with pytest.raises(PermissionError):
             await handler.tell(mock_session, params)
 
     @pytest.mark.asyncio
@@ -306,7 +317,7 @@ class TestCommunicationHandler:
 
         assert result["status"] == "sent"
         assert "message_id" in result
-        handler.gateway.send_packet.assert_called_once()
+        assert len(handler.gateway.sent) == 1
 
     @pytest.mark.asyncio
     async def test_emoteto_missing_params(self, handler, mock_session):
@@ -338,7 +349,7 @@ class TestInformationHandler:
 
         assert result["status"] == "request_sent"
         assert "request_id" in result
-        handler.gateway.send_packet.assert_called_once()
+        assert len(handler.gateway.sent) == 1
 
     @pytest.mark.asyncio
     async def test_who_request_with_filter(self, handler, mock_session):
@@ -349,7 +360,7 @@ class TestInformationHandler:
 
         assert result["status"] == "request_sent"
         assert "request_id" in result
-        handler.gateway.send_packet.assert_called_once()
+        assert len(handler.gateway.sent) == 1
 
     @pytest.mark.asyncio
     async def test_finger_request(self, handler, mock_session):
@@ -360,7 +371,7 @@ class TestInformationHandler:
 
         assert result["status"] == "request_sent"
         assert "request_id" in result
-        handler.gateway.send_packet.assert_called_once()
+        assert len(handler.gateway.sent) == 1
 
     @pytest.mark.asyncio
     async def test_finger_request_missing_user(self, handler, mock_session):
@@ -379,7 +390,7 @@ class TestInformationHandler:
 
         assert result["status"] == "request_sent"
         assert "request_id" in result
-        handler.gateway.send_packet.assert_called_once()
+        assert len(handler.gateway.sent) == 1
 
     @pytest.mark.asyncio
     async def test_locate_request_missing_username(self, handler, mock_session):
@@ -407,7 +418,7 @@ class TestChannelHandler:
 
         assert result["status"] == "sent"
         assert "message_id" in result
-        handler.gateway.send_packet.assert_called_once()
+        assert len(handler.gateway.sent) == 1
 
     @pytest.mark.asyncio
     async def test_channel_emote(self, handler, mock_session):
@@ -418,14 +429,14 @@ class TestChannelHandler:
 
         assert result["status"] == "sent"
         assert "message_id" in result
-        handler.gateway.send_packet.assert_called_once()
+        assert len(handler.gateway.sent) == 1
 
     @pytest.mark.asyncio
     async def test_channel_listen(self, handler, mock_session):
         """Test listening to a channel."""
         params = {"channel": "chat"}
 
-        with patch("src.api.subscriptions.subscription_manager") as mock_sub_mgr:
+        with patch(f"{__name__}.subscription_manager") as mock_sub_mgr:
             mock_sub_mgr.add_subscription = MagicMock()
 
             result = await handler.channel_listen(mock_session, params)
@@ -439,7 +450,7 @@ class TestChannelHandler:
         """Test unlistening from a channel."""
         params = {"channel": "chat"}
 
-        with patch("src.api.subscriptions.subscription_manager") as mock_sub_mgr:
+        with patch(f"{__name__}.subscription_manager") as mock_sub_mgr:
             mock_sub_mgr.remove_subscription = MagicMock()
 
             result = await handler.channel_unlisten(mock_session, params)
@@ -457,7 +468,7 @@ class TestChannelHandler:
 
         assert result["status"] == "request_sent"
         assert "request_id" in result
-        handler.gateway.send_packet.assert_called_once()
+        assert len(handler.gateway.sent) == 1
 
     @pytest.mark.asyncio
     async def test_channel_message_missing_params(self, handler, mock_session):
@@ -500,11 +511,11 @@ class TestAdminHandler:
     @pytest.mark.asyncio
     async def test_gateway_status_no_permission(self, handler, mock_session):
         """Test gateway status without admin permission."""
-        mock_session.has_permission.side_effect = lambda perm: perm != "admin"
+        mock_session.permissions.discard("admin")
 
         params = {}
 
-        with pytest.raises(Exception):  # Should raise PermissionError
+        with pytest.raises(PermissionError):
             await handler.gateway_status(mock_session, params)
 
     @pytest.mark.asyncio
@@ -535,9 +546,9 @@ class TestAdminHandler:
         params = {}
 
         # Mock gateway mudlist
-        handler.gateway.get_mudlist = MagicMock(
-            return_value={"TestMUD": {"host": "test.mud.com", "port": 4000, "status": "online"}}
-        )
+        handler.gateway.mudlist = {
+            "TestMUD": {"host": "test.mud.com", "port": 4000, "status": "online"}
+        }
 
         result = await handler.get_mudlist(mock_session, params)
 
@@ -550,24 +561,20 @@ class TestAdminHandler:
         """Test forcing gateway reconnection."""
         params = {}
 
-        handler.gateway.reconnect = AsyncMock()
-
         result = await handler.force_reconnect(mock_session, params)
 
         assert result["status"] == "reconnection_initiated"
-        handler.gateway.reconnect.assert_called_once()
+        assert handler.gateway.reconnects == 1
 
     @pytest.mark.asyncio
     async def test_shutdown_gateway(self, handler, mock_session):
         """Test shutting down gateway."""
         params = {"confirm": True}
 
-        handler.gateway.shutdown = AsyncMock()
-
         result = await handler.shutdown_gateway(mock_session, params)
 
         assert result["status"] == "shutdown_initiated"
-        handler.gateway.shutdown.assert_called_once()
+        assert handler.gateway.shutdowns == 1
 
     @pytest.mark.asyncio
     async def test_shutdown_gateway_no_confirm(self, handler, mock_session):
@@ -605,15 +612,15 @@ class TestHandlerIntegration:
         handler = CommunicationHandler(mock_gateway)
 
         # Test permission error - modify session to not have tell permission
-        mock_session.has_permission = MagicMock(side_effect=lambda perm: perm != "tell")
+        mock_session.permissions.discard("tell")
 
-        with pytest.raises(Exception):
+        with pytest.raises(PermissionError):
             await handler.tell(
                 mock_session, {"target_mud": "OtherMUD", "target_user": "alice", "message": "hello"}
             )
 
         # Test parameter validation error
-        mock_session.has_permission = MagicMock(return_value=True)
+        mock_session.permissions = {"*"}
 
         with pytest.raises(ValueError):
             await handler.tell(
@@ -634,11 +641,10 @@ class TestHandlerIntegration:
         await handler.tell(mock_session, params)
 
         # Verify gateway send_packet was called
-        mock_gateway.send_packet.assert_called_once()
+        assert len(mock_gateway.sent) == 1
 
         # Verify the packet type and structure
-        call_args = mock_gateway.send_packet.call_args[0]
-        packet = call_args[0]
+        packet = mock_gateway.sent[0]
         # Mock packet structure - in real implementation this would be a proper packet object
         assert packet["target_mud"] == "OtherMUD"
         assert packet["target_user"] == "alice"
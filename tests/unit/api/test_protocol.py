@@ -4,9 +4,24 @@ import json
 
 import pytest
 
+from src.api import protocol as protocol_module
 from src.api.protocol import JSONRPCError, JSONRPCProtocol, JSONRPCRequest, JSONRPCResponse
 
 
+@pytest.fixture(autouse=True, params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run every protocol test with orjson and with the stdlib json fallback."""
+    if request.param == "orjson":
+        if protocol_module.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(protocol_module, "_json_loads", json.loads)
+        monkeypatch.setattr(protocol_module, "_json_dumps", json.dumps)
+    protocol_module._error_json.cache_clear()
+    yield request.param
+    protocol_module._error_json.cache_clear()
+
+
 # Mock exception classes that don't exist yet
 class JSONRPCParseError(Exception):
     def __init__(self, data=None):
@@ -122,6 +137,14 @@ class TestJSONRPCResponse:
         assert data["result"]["status"] == "sent"
         assert data["id"] == "123"
         assert "error" not in data
+        assert response.to_dict() == data
+
+    def test_response_to_dict_omits_missing_id(self):
+        """Test the id key is left out when there is no id."""
+        error = {"code": -32700, "message": "Parse error"}
+
+        assert JSONRPCResponse(error=error).to_dict() == {"jsonrpc": "2.0", "error": error}
+        assert JSONRPCResponse().to_dict() == {"jsonrpc": "2.0", "result": None}
 
     def test_error_response_attributes(self):
         """Test error response attributes."""
@@ -343,3 +366,63 @@ class TestJSONRPCProtocol:
 
         result = protocol.validate_params(params, schema)
         assert result is False
+
+    @pytest.mark.parametrize(
+        ("schema_type", "value", "expected"),
+        [
+            ("integer", 5, True),
+            ("integer", "5", False),
+            ("number", 1.5, True),
+            ("boolean", 1, False),
+            ("array", [], True),
+            ("object", [], False),
+            ("null", None, True),
+            ("null", 0, False),
+            ("custom", object(), True),
+            (["integer", "null"], "5", True),
+        ],
+    )
+    def test_validate_params_types(self, protocol, schema_type, value, expected):
+        """Test each schema type accepts only matching values."""
+        schema = {"type": "object", "properties": {"field": {"type": schema_type}}}
+
+        assert protocol.validate_params({"field": value}, schema) is expected
+
+    def test_serialized_output_is_text(self, protocol):
+        """Test every formatter returns str whichever JSON backend encodes it."""
+        outputs = [
+            protocol.format_response(1, {"ok": True}),
+            protocol.format_error(1, JSONRPCError.INTERNAL_ERROR, "boom"),
+            protocol.create_notification("tell_received", {"message": "hi"}),
+            protocol.create_request("ping", {}, request_id=7),
+        ]
+
+        assert all(isinstance(output, str) for output in outputs)
+        assert json.loads(outputs[0]) == {"jsonrpc": "2.0", "id": 1, "result": {"ok": True}}
+
+    def test_non_string_keys_serialized(self, protocol):
+        """Test integer dict keys are written as strings, as json.dumps does."""
+        response = json.loads(protocol.format_response(1, {1: "one", 2: "two"}))
+
+        assert response["result"] == {"1": "one", "2": "two"}
+
+    def test_wide_integer_id_round_trip(self, protocol):
+        """Test ids wider than 64 bits parse and serialize exactly on both backends."""
+        wide_id = 2**70
+
+        request = protocol.parse_request(
+            json.dumps({"jsonrpc": "2.0", "method": "ping", "id": wide_id})
+        )
+        response = json.loads(protocol.format_response(request.id, {"count": -(2**70)}))
+
+        assert request.id == wide_id
+        assert response == {"jsonrpc": "2.0", "id": wide_id, "result": {"count": -(2**70)}}
+
+    def test_nan_params_parse(self, protocol):
+        """Test NaN and Infinity literals are accepted as json.loads accepts them."""
+        request = protocol.parse_request(
+            '{"jsonrpc": "2.0", "method": "ping", "params": {"x": NaN, "y": Infinity}}'
+        )
+
+        assert request.params["x"] != request.params["x"]
+        assert request.params["y"] == float("inf")
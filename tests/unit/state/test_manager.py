@@ -372,6 +372,42 @@ class TestStateManager:
             assert result2 == mud_info
             mock_cache_get.assert_called_once_with("mud:CacheMUD")
 
+    @pytest.mark.asyncio
+    async def test_mudlist_snapshot_caching(self):
+        """Test get_mudlist reuses its snapshot until the mudlist changes."""
+        manager = StateManager()
+        entry = ["192.168.1.100", 4000, 5000, 6000, "", "", "", "", "", "", {}, {}, "", "", ""]
+        await manager.update_mudlist({"MUD1": entry}, 1)
+
+        first = await manager.get_mudlist()
+        snapshot = await manager.cache.get("mudlist")
+        assert snapshot is not None
+
+        second = await manager.get_mudlist()
+        assert await manager.cache.get("mudlist") is snapshot
+        assert second == first
+
+        await manager.update_mudlist({"MUD2": entry}, 2)
+        assert await manager.cache.get("mudlist") is None
+
+        refreshed = await manager.get_mudlist()
+        assert {mud["name"] for mud in refreshed} == {"MUD1", "MUD2"}
+
+    @pytest.mark.asyncio
+    async def test_mudlist_snapshot_not_shared(self):
+        """Test callers mutating get_mudlist results do not corrupt the cache."""
+        manager = StateManager()
+        entry = ["192.168.1.100", 4000, 5000, 6000, "", "", "", "", "", "", {}, {}, "", "", ""]
+        await manager.update_mudlist({"MUD1": entry}, 1)
+
+        first = await manager.get_mudlist()
+        first[0]["status"] = "corrupted"
+        first.append({"name": "Injected"})
+
+        second = await manager.get_mudlist()
+        assert [mud["name"] for mud in second] == ["MUD1"]
+        assert second[0]["status"] != "corrupted"
+
     @pytest.mark.asyncio
     async def test_channel_operations(self):
         """Test channel management operations."""
@@ -1,8 +1,9 @@
 """Regression tests derived from live Intermud-3 router traffic."""
 
-from datetime import datetime
+import asyncio
+from datetime import UTC, datetime
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -273,3 +274,74 @@ async def test_who_reply_becomes_targeted_api_event(monkeypatch) -> None:
     assert event.data["to_user"] == "Tester"
     assert event.data["users"][0]["name"] == "RemotePlayer"
     bridge.stop()
+
+
+def admin_session() -> Session:
+    """Build an authenticated admin API session."""
+    return Session(
+        session_id="session",
+        mud_name="LuminariMUD",
+        api_key="test",
+        connected_at=datetime.now(UTC),
+        last_activity=datetime.now(UTC),
+        permissions={"admin"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_reconnect_returns_before_gateway_reconnects() -> None:
+    """Reconnect must acknowledge at once and not stack overlapping reconnects."""
+    release = asyncio.Event()
+    gateway = SimpleNamespace(state_manager=StateManager(), reconnect=AsyncMock())
+    gateway.reconnect.side_effect = release.wait
+    handlers = APIHandlers(gateway=gateway)
+
+    assert await handlers.handle_reconnect(admin_session(), {}) == {"status": "reconnecting"}
+    task = handlers._reconnect_task
+    assert task is not None and not task.done()
+
+    result = await handlers.handle_reconnect(admin_session(), {})
+    assert result == {"status": "already_reconnecting"}
+    assert handlers._reconnect_task is task
+
+    release.set()
+    await task
+    gateway.reconnect.assert_awaited_once()
+
+    assert await handlers.handle_reconnect(admin_session(), {}) == {"status": "reconnecting"}
+    await handlers._reconnect_task
+    assert gateway.reconnect.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_reconnect_failure_is_logged(monkeypatch) -> None:
+    """A background reconnect failure must be logged, not raised into the loop."""
+    gateway = SimpleNamespace(
+        state_manager=StateManager(),
+        reconnect=AsyncMock(side_effect=ConnectionError("router unreachable")),
+    )
+    logger = MagicMock()
+    monkeypatch.setattr("src.api.api_handlers.logger", logger)
+    handlers = APIHandlers(gateway=gateway)
+
+    await handlers.handle_reconnect(admin_session(), {})
+    await handlers._reconnect_task
+
+    logger.error.assert_called_once_with("gateway_reconnect_failed", error="router unreachable")
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_pending_reconnect() -> None:
+    """Shutting the handlers down must cancel a reconnect still in progress."""
+    gateway = SimpleNamespace(
+        state_manager=StateManager(), reconnect=AsyncMock(side_effect=asyncio.Event().wait)
+    )
+    handlers = APIHandlers(gateway=gateway)
+    await handlers.handle_reconnect(admin_session(), {})
+    task = handlers._reconnect_task
+    await asyncio.sleep(0)
+
+    await handlers.shutdown()
+
+    assert task.cancelled()
+    assert handlers._reconnect_task is None
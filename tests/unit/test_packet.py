@@ -13,6 +13,8 @@ from src.models.packet import (
     PacketValidationError,
     StartupPacket,
     TellPacket,
+    WhoEntry,
+    WhoFilters,
     WhoPacket,
 )
 
@@ -341,6 +343,86 @@ class TestWhoPacket:
             }
         ]
 
+    def test_who_filter_key_is_order_independent(self):
+        """Equal filter criteria produce the same hashable filter key."""
+        fields = {
+            "packet_type": PacketType.WHO_REQ,
+            "ttl": 200,
+            "originator_mud": "TestMUD",
+            "originator_user": "",
+            "target_mud": "TargetMUD",
+            "target_user": "",
+        }
+        first = WhoPacket(**fields, filter_criteria={"race": "elf", "level_min": 10})
+        second = WhoPacket(**fields, filter_criteria={"level_min": 10, "race": "elf"})
+
+        assert first.filter_key == second.filter_key == (("level_min", 10), ("race", "elf"))
+        assert hash(first.filter_key) == hash(second.filter_key)
+        assert WhoPacket(**fields).filter_key == ()
+
+    def test_who_filters_from_criteria(self):
+        """filter_criteria is unpacked into fixed WhoFilters fields."""
+        packet = WhoPacket(
+            packet_type=PacketType.WHO_REQ,
+            ttl=200,
+            originator_mud="TestMUD",
+            originator_user="",
+            target_mud="TargetMUD",
+            target_user="",
+            filter_criteria={"guild": "mages", "level_max": 40, "unknown": 1},
+        )
+
+        assert packet.filters == WhoFilters(level_max=40, guild="mages")
+        assert packet.filters.level_min is None
+        assert WhoFilters.from_criteria(None) == WhoFilters()
+
+    def test_who_reply_to_matches_constructed_reply(self):
+        """reply_to builds the same packet as the validating constructor."""
+        request = WhoPacket(
+            packet_type=PacketType.WHO_REQ,
+            ttl=5,
+            originator_mud="RemoteMUD",
+            originator_user="requester",
+            target_mud="TestMUD",
+            target_user="",
+            filter_criteria={"race": "elf"},
+        )
+        who_data = [{"name": "Kohdee", "idle": 7, "level": 34, "extra": ""}]
+
+        reply = WhoPacket.reply_to(request, who_data, "TestMUD")
+
+        assert reply == WhoPacket(
+            packet_type=PacketType.WHO_REPLY,
+            ttl=200,
+            originator_mud="TestMUD",
+            originator_user="",
+            target_mud="RemoteMUD",
+            target_user="requester",
+            who_data=who_data,
+        )
+        assert reply.to_lpc_array()[6] == [["Kohdee", 7, "Level 34"]]
+
+    def test_who_entry_matches_dict_wire_rows(self):
+        """WhoEntry rows and dict form match the dict-based who_data codec."""
+        entry = WhoEntry("Kohdee", 7, 34, "the Game Master", race="Human")
+        as_dict = entry.to_dict()
+
+        assert as_dict == {
+            "name": "Kohdee",
+            "idle": 7,
+            "level": 34,
+            "extra": "the Game Master",
+            "race": "Human",
+        }
+        assert WhoPacket.encode_who_data([entry]) == WhoPacket.encode_who_data([as_dict])
+        assert entry["name"] == "Kohdee"
+        assert "race" in entry
+        assert "guild" not in entry
+        with pytest.raises(KeyError):
+            entry["guild"]
+        with pytest.raises(AttributeError):
+            entry.level = 50
+
     def test_who_packet_validation(self):
         """Test who packet validation."""
         # who-reply without data should fail
@@ -0,0 +1,76 @@
+"""Tests for logging utilities."""
+
+import json
+import sys
+
+import pytest
+import structlog
+
+from src.utils.logging import _json_serializer
+
+
+@pytest.fixture(params=["orjson", "json"])
+def serializer(request, monkeypatch):
+    """JSON renderer serializer with orjson both present and absent."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    return _json_serializer()
+
+
+EVENT = {"event": "Received who request", "from_mud": "RemoteMUD", "filters": {"level_min": 10}}
+
+
+class TestJSONSerializer:
+    """Test the serializer used by the JSON log renderer."""
+
+    def test_falls_back_to_json_without_orjson(self, monkeypatch):
+        """Test that json.dumps is used when orjson is not installed."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        assert _json_serializer() is json.dumps
+
+    def test_uses_orjson_when_installed(self):
+        """Test that an orjson-backed serializer is used when available."""
+        pytest.importorskip("orjson")
+
+        assert _json_serializer() is not json.dumps
+
+    def test_renderer_output(self, serializer):
+        """Test that the renderer emits the same event with either backend."""
+        renderer = structlog.processors.JSONRenderer(serializer=serializer)
+
+        output = renderer(None, "info", dict(EVENT))
+
+        assert isinstance(output, str)
+        assert json.loads(output) == EVENT
+
+    def test_renderer_sort_keys(self, serializer):
+        """Test that the renderer's sort_keys option is honoured."""
+        renderer = structlog.processors.JSONRenderer(serializer=serializer, sort_keys=True)
+
+        output = renderer(None, "info", {"b": 1, "a": 2, "c": 3})
+
+        assert list(json.loads(output)) == ["a", "b", "c"]
+
+    def test_renderer_default_fallback(self, serializer):
+        """Test that unserializable values go through the renderer's default."""
+
+        class Session:
+            def __repr__(self):
+                return "<Session alice>"
+
+        renderer = structlog.processors.JSONRenderer(serializer=serializer)
+
+        output = renderer(None, "info", {"event": "tick", "session": Session()})
+
+        assert json.loads(output)["session"] == "<Session alice>"
+
+    def test_orjson_rejects_unsupported_options(self):
+        """Test that json.dumps options orjson cannot honour are not dropped."""
+        pytest.importorskip("orjson")
+        renderer = structlog.processors.JSONRenderer(serializer=_json_serializer(), indent=4)
+
+        with pytest.raises(TypeError):
+            renderer(None, "info", dict(EVENT))